@@ -0,0 +1,16 @@
+"""Slim settings for cron-style batch management commands.
+
+Batch commands only need the ORM, cache and mail, so the admin, DRF, SimpleJWT,
+sessions, messages, static files, templates and middleware are left out and
+Django setup never imports them. ``manage.py`` selects this module for the
+commands in ``BATCH_COMMANDS`` unless ``DJANGO_SETTINGS_MODULE`` is already set.
+"""
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "main_app",
+]
+MIDDLEWARE: list[str] = []
+TEMPLATES: list[dict] = []
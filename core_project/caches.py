@@ -0,0 +1,34 @@
+"""Build ``CACHES`` from the environment.
+
+``CACHE_URL`` selects a cache shared by every worker process:
+
+* ``redis://host:6379/0`` (or ``rediss://``) uses Django's Redis cache (requires ``redis``).
+* ``memcached://host:11211`` uses ``PyMemcacheCache`` (requires ``pymemcache``).
+
+Without it each process gets its own ``LocMemCache``, which only suits a single
+worker: entries written by one process are invisible to the others.
+"""
+from __future__ import annotations
+
+import os
+from urllib.parse import urlsplit
+
+LOCMEM_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+REDIS_SCHEMES = {"redis", "rediss"}
+
+
+def cache_from_env(environ=os.environ) -> dict:
+    """Return the ``default`` cache settings for the current environment."""
+
+    url = environ.get("CACHE_URL", "")
+    if not url:
+        return {"BACKEND": LOCMEM_BACKEND}
+    parts = urlsplit(url)
+    if parts.scheme in REDIS_SCHEMES:
+        return {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": url}
+    if parts.scheme == "memcached":
+        return {
+            "BACKEND": "django.core.cache.backends.memcached.PyMemcacheCache",
+            "LOCATION": parts.netloc,
+        }
+    raise ValueError(f"Unsupported CACHE_URL scheme: {parts.scheme!r}")
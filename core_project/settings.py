@@ -1,7 +1,11 @@
 """Django settings for the core_project project."""
+import os
 from datetime import timedelta
 from pathlib import Path
 
+from .caches import cache_from_env
+from .database import database_from_env, replica_from_env
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = "django-insecure-temp-secret-key"
@@ -51,12 +55,27 @@ TEMPLATES = [
 WSGI_APPLICATION = "core_project.wsgi.application"
 ASGI_APPLICATION = "core_project.asgi.application"
 
+# Configured through DATABASE_URL / DB_* environment variables; see core_project/database.py.
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": database_from_env(BASE_DIR),
+}
+if replica := replica_from_env(BASE_DIR):
+    DATABASES["replica"] = replica
+
+# Configured through CACHE_URL; see core_project/caches.py. Without it every worker
+# process has its own cache.
+CACHES = {
+    "default": cache_from_env(),
 }
+# Cache window-feed ids per day block (main_app/windows.py). Writes invalidate the
+# blocks in the default cache, so this needs a cache shared by all workers.
+WINDOW_BUCKET_INDEX = bool(os.environ.get("CACHE_URL"))
+
+# Reporting reads go to this alias when it is configured (see main_app/routers.py);
+# users are pinned to ``default`` for REPLICA_PIN_SECONDS after changing a contract.
+DATABASE_ROUTERS = ["main_app.routers.ReportingReplicaRouter"]
+REPORTING_DATABASE = "replica"
+REPLICA_PIN_SECONDS = 10
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -90,10 +109,32 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # Per-user limits (client IP for anonymous requests), counted in the default cache.
+    "DEFAULT_THROTTLE_RATES": {
+        "reminders": "60/min",
+        "send_emails": "5/hour",
+    },
+}
+# API_THROTTLING=off serves without those limits, e.g. for `load_test_api --base-url`.
+API_THROTTLING = os.environ.get("API_THROTTLING", "on").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+    "off",
 }
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 DEFAULT_FROM_EMAIL = "reminders@example.com"
+# "single" sends through the newest active EmailCredential; "balanced" spreads
+# reminders over all active credentials by weight, failing over between them.
+REMINDER_EMAIL_DISPATCH = "single"
+# Failed reminder emails are re-sent by `retry_failed_reminders` after
+# BASE, 2*BASE, 4*BASE... seconds, up to MAX_ATTEMPTS sends in total.
+REMINDER_RETRY_BASE_SECONDS = 300
+REMINDER_RETRY_MAX_ATTEMPTS = 5
+
+# Horizons (in days) summarised side by side on the admin reminder dashboard.
+REMINDER_REPORT_WINDOWS = (7, 15, 30)
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
@@ -1,45 +1,110 @@
+from django.conf import settings
 from django.contrib import admin, messages
+from django.core.paginator import Paginator
+from django.db.models import Q
 from django.template.response import TemplateResponse
-from django.urls import path
+from django.urls import path, reverse
+from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
-from .models import EmailCredential, EmailLog, ServiceContract, Vendor
-from .reminders import ReminderService
+from .jobs import start_reminder_job
+from .models import EmailCredential, EmailLog, ReminderJob, ServiceContract, Vendor
+from .paginators import EstimatedCountPaginator
+from .reminders import COLOR_PRIORITY, ReminderEngine, ReminderService
+from .search import KIND_SERVICE, KIND_VENDOR, get_search_backend
+
+
+class FullTextSearchAdminMixin:
+    """Serves the changelist search box from the full-text index.
+
+    ``search_fields`` stay declared so the admin renders the search box, but the
+    lookup is delegated to :meth:`search_condition` instead of ``icontains`` scans.
+    Admins that do not override it keep the stock ``search_fields`` search.
+    """
+
+    def search_condition(self, backend, search_term: str) -> Q | None:
+        return None
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        backend = get_search_backend(queryset.db)
+        condition = self.search_condition(backend, search_term)
+        if condition is None:
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(condition), False
 
 
 @admin.register(Vendor)
-class VendorAdmin(admin.ModelAdmin):
+class VendorAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = ("name", "contact_person", "email", "status")
     search_fields = ("name", "contact_person", "email")
     list_filter = ("status",)
 
+    def search_condition(self, backend, search_term):
+        return Q(pk__in=backend.matching_ids(search_term, KIND_VENDOR))
+
 
 @admin.register(ServiceContract)
-class ServiceContractAdmin(admin.ModelAdmin):
+class ServiceContractAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     list_display = (
         "service_name",
-        "vendor",
+        "vendor_name",
         "expiry_date",
         "payment_due_date",
         "status",
     )
-    search_fields = ("service_name", "vendor__name")
+    search_fields = ("service_name", "vendor_name")
     list_filter = ("status",)
+    date_hierarchy = "expiry_date"
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     autocomplete_fields = ("vendor",)
     actions = ("run_contract_reminders",)
     change_list_template = "admin/main_app/servicecontract/change_list.html"
 
+    def search_condition(self, backend, search_term):
+        return Q(pk__in=backend.matching_ids(search_term, KIND_SERVICE)) | Q(
+            vendor_id__in=backend.matching_ids(search_term, KIND_VENDOR)
+        )
+
+    # Selections larger than this are emailed by a background job.
+    reminder_background_threshold = 200
+
     def run_contract_reminders(self, request, queryset):
-        service = ReminderService()
-        payloads = service.send_notification_emails()
+        contract_ids = list(queryset.values_list("pk", flat=True))
+        if len(contract_ids) > self.reminder_background_threshold:
+            job = ReminderJob.objects.create(
+                contract_ids=contract_ids, total=len(contract_ids), requested_by=request.user
+            )
+            start_reminder_job(job)
+            self.message_user(
+                request,
+                format_html(
+                    _(
+                        "Queued reminder job #{} for {} contract(s); "
+                        '<a href="{}">follow its progress</a>.'
+                    ),
+                    job.pk,
+                    len(contract_ids),
+                    reverse("admin:main_app_reminderjob_change", args=[job.pk]),
+                ),
+                messages.SUCCESS,
+            )
+            return
+        service = ReminderService(using=queryset.db)
+        payloads = service.send_notification_emails(queryset)
         self.message_user(
             request,
-            _(f"Triggered reminder emails for {len(payloads)} contract(s)."),
+            _(
+                f"Triggered reminder emails for {len(payloads)} of "
+                f"{len(contract_ids)} selected contract(s)."
+            ),
             messages.SUCCESS,
         )
 
     run_contract_reminders.short_description = _(
-        "Run reminder email dispatch now"
+        "Run reminder email dispatch for selected contracts"
     )
 
     def get_urls(self):
@@ -53,17 +118,37 @@ class ServiceContractAdmin(admin.ModelAdmin):
         ]
         return custom_urls + urls
 
+    reminder_report_page_size = 100
+
     def reminder_report_view(self, request):
-        report = ReminderService().build_report()
+        """Cached color totals plus one page of payloads for the selected window/color."""
+
+        default_window = ReminderService().window_days
+        windows = sorted(set(settings.REMINDER_REPORT_WINDOWS) | {default_window})
+        reports = ReminderEngine(windows).cached_aggregate_report()
+        try:
+            window_days = int(request.GET.get("window", default_window))
+        except ValueError:
+            window_days = default_window
+        if window_days not in reports:
+            window_days = default_window
+        color = request.GET.get("color", "")
+        if color not in COLOR_PRIORITY:
+            color = ""
+        report = reports[window_days]
         report_dict = report.as_dict()
+
+        service = ReminderService(window_days=window_days, as_of=report.generated_on)
+        paginator = Paginator(service.color_queryset(color), self.reminder_report_page_size)
+        page = paginator.get_page(request.GET.get("p"))
         color_rows = []
-        for color in ("red", "yellow", "green"):
+        for name in ("red", "yellow", "green"):
             color_rows.append(
                 {
-                    "name": color,
-                    "overall": report_dict["totals_by_color"].get(color, 0),
-                    "expiry": report_dict["expiry_totals_by_color"].get(color, 0),
-                    "payment": report_dict["payment_totals_by_color"].get(color, 0),
+                    "name": name,
+                    "overall": report_dict["totals_by_color"].get(name, 0),
+                    "expiry": report_dict["expiry_totals_by_color"].get(name, 0),
+                    "payment": report_dict["payment_totals_by_color"].get(name, 0),
                 }
             )
         context = {
@@ -72,6 +157,20 @@ class ServiceContractAdmin(admin.ModelAdmin):
             "report": report,
             "report_data": report_dict,
             "color_rows": color_rows,
+            "window_rows": [
+                {
+                    "window_days": days,
+                    "total": window_report.total_contracts,
+                    "red": window_report.totals_by_color["red"],
+                    "yellow": window_report.totals_by_color["yellow"],
+                    "green": window_report.totals_by_color["green"],
+                }
+                for days, window_report in reports.items()
+            ],
+            "selected_window": window_days,
+            "selected_color": color,
+            "page_obj": page,
+            "payloads": service.payloads_for(page.object_list),
             "title": _("Reminder report"),
         }
         return TemplateResponse(
@@ -81,31 +180,82 @@ class ServiceContractAdmin(admin.ModelAdmin):
         )
 
 
+@admin.register(ReminderJob)
+class ReminderJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "__str__",
+        "status",
+        "progress_display",
+        "sent",
+        "requested_by",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("status",)
+    list_select_related = ("requested_by",)
+    exclude = ("contract_ids",)
+    readonly_fields = (
+        "status",
+        "progress_display",
+        "total",
+        "processed",
+        "sent",
+        "error_message",
+        "requested_by",
+        "created_at",
+        "finished_at",
+    )
+
+    @admin.display(description=_("Progress"))
+    def progress_display(self, obj):
+        return f"{obj.processed}/{obj.total} ({obj.progress}%)"
+
+    def has_add_permission(self, request):  # pragma: no cover - admin integration
+        return False
+
+    def has_change_permission(self, request, obj=None):  # pragma: no cover
+        return False
+
+
 @admin.register(EmailCredential)
 class EmailCredentialAdmin(admin.ModelAdmin):
-    list_display = ("name", "from_email", "smtp_host", "smtp_port", "is_active")
-    list_editable = ("is_active",)
+    list_display = ("name", "from_email", "smtp_host", "smtp_port", "weight", "is_active")
+    list_editable = ("weight", "is_active")
     search_fields = ("name", "from_email", "smtp_host")
     readonly_fields = ("created_at", "updated_at")
 
 
 @admin.register(EmailLog)
-class EmailLogAdmin(admin.ModelAdmin):
-    list_display = ("contract", "recipient", "success", "created_at")
-    search_fields = ("recipient", "contract__service_name", "contract__vendor__name")
-    list_filter = ("success", "contract__status")
+class EmailLogAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
+    list_display = ("contract", "recipient", "success", "attempts", "next_retry_at", "created_at")
+    search_fields = ("recipient", "contract__service_name", "contract__vendor_name")
+    list_filter = ("success", "contract__status", "credential")
+    list_select_related = ("contract",)
+    date_hierarchy = "created_at"
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     readonly_fields = (
         "contract",
+        "credential",
         "recipient",
         "sender",
         "subject",
         "body",
         "success",
         "error_message",
+        "attempts",
+        "next_retry_at",
         "created_at",
         "updated_at",
     )
 
+    def search_condition(self, backend, search_term):
+        return (
+            Q(recipient__istartswith=search_term.strip())
+            | Q(contract_id__in=backend.matching_ids(search_term, KIND_SERVICE))
+            | Q(contract__vendor_id__in=backend.matching_ids(search_term, KIND_VENDOR))
+        )
+
     def has_add_permission(self, request):  # pragma: no cover - admin integration
         return False
 
@@ -0,0 +1,213 @@
+"""Async (ASGI) variants of the read-only reminder and window feed endpoints.
+
+DRF views are synchronous, so these are plain Django async views that reuse the
+DRF serializers for output and authenticate JWT bearer tokens with an async user
+lookup. Under an ASGI server a single worker can serve many concurrent polls
+without tying up a thread per request. The reminder feeds share the per-user
+throttle budget of their sync twins, and concurrent report builds coalesce.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import wraps
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_safe
+from rest_framework.exceptions import NotFound, Throttled
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .coalescing import AsyncSingleFlight
+from .conditional import aconditional_response, report_validators
+from .filters import WindowParamsSerializer
+from .reminders import ReminderService
+from .routers import reporting_reads
+from .serializers import ReminderReportSerializer, ReminderSerializer, ServiceContractSerializer
+from .throttling import ScopedThrottle
+from .windows import DayBucketIndex
+
+SERIALIZE_CHUNK_SIZE = 500
+# Dashboards polling at the same moment share one report build per data version.
+report_flight = AsyncSingleFlight()
+
+
+async def authenticate(request):
+    """Return the active user for the request's bearer token, or ``None``."""
+
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    raw_token = authentication.get_raw_token(header) if header else None
+    if raw_token is None:
+        return None
+    token = authentication.get_validated_token(raw_token)
+    try:
+        user_id = token[jwt_settings.USER_ID_CLAIM]
+    except KeyError:
+        raise InvalidToken("Token contained no recognizable user identification")
+    return await (
+        get_user_model()
+        .objects.filter(**{jwt_settings.USER_ID_FIELD: user_id, "is_active": True})
+        .afirst()
+    )
+
+
+def jwt_required(view):
+    """Reject unauthenticated requests with the same 401 body DRF would send."""
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            user = await authenticate(request)
+        except (InvalidToken, TokenError):
+            user, detail = None, "Given token not valid for any token type"
+        else:
+            detail = "Authentication credentials were not provided."
+        if user is None:
+            return JsonResponse(
+                {"detail": detail},
+                status=401,
+                headers={"WWW-Authenticate": 'Bearer realm="api"'},
+            )
+        request.user = user
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+def throttled(scope: str):
+    """Apply the ``ScopedThrottle`` of the sync views for ``scope`` (same budget)."""
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            throttle = ScopedThrottle()
+            scoped_view = SimpleNamespace(throttle_scope=scope)
+            if not await sync_to_async(throttle.allow_request)(request, scoped_view):
+                wait = throttle.wait()
+                headers = {"Retry-After": "%d" % wait} if wait is not None else {}
+                return JsonResponse(
+                    {"detail": str(Throttled(wait).detail)}, status=429, headers=headers
+                )
+            return await view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def reporting(view):
+    """Async counterpart of ``ReportingReadsMixin``: reads go to the reporting replica."""
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        with reporting_reads(request):
+            return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+async def serialize_payloads(payloads) -> list:
+    """Serialize an async payload stream in chunks so few payloads are held at once."""
+
+    data: list = []
+    chunk: list = []
+    async for payload in payloads:
+        chunk.append(payload)
+        if len(chunk) >= SERIALIZE_CHUNK_SIZE:
+            data.extend(ReminderSerializer(chunk, many=True).data)
+            chunk = []
+    if chunk:
+        data.extend(ReminderSerializer(chunk, many=True).data)
+    return data
+
+
+@require_safe
+async def ping(request):
+    return JsonResponse({"message": "pong"})
+
+
+@require_safe
+@jwt_required
+@throttled("reminders")
+@reporting
+async def reminder_list(request):
+    service = ReminderService()
+
+    async def render():
+        data = await serialize_payloads(service.aiter_reminder_payloads())
+        return JsonResponse(data, safe=False)
+
+    etag, last_modified = await sync_to_async(report_validators)(
+        service.as_of, service.window_days
+    )
+    return await aconditional_response(request, etag, last_modified, render)
+
+
+@require_safe
+@jwt_required
+@throttled("reminders")
+@reporting
+async def reminder_report(request):
+    service = ReminderService()
+
+    async def build():
+        report = await service.abuild_report()
+        data = dict(ReminderReportSerializer(replace(report, payloads=[])).data)
+        data["payloads"] = await serialize_payloads(report.payloads)
+        return data
+
+    async def render():
+        return JsonResponse(await report_flight.do((service.using, etag), build))
+
+    etag, last_modified = await sync_to_async(report_validators)(
+        service.as_of, service.window_days
+    )
+    return await aconditional_response(request, etag, last_modified, render)
+
+
+async def _window_feed(request, field_name: str):
+    drf_request = Request(request)
+    params = WindowParamsSerializer(data=request.GET)
+    if not params.is_valid():
+        return JsonResponse(params.errors, status=400)
+    today, days = timezone.localdate(), params.validated_data["days"]
+    index = DayBucketIndex(field_name)
+    ids = await index.acontract_ids(today, days)
+    paginator = PageNumberPagination()
+    try:
+        page_ids = paginator.paginate_queryset(ids, drf_request)
+    except NotFound as exc:
+        return JsonResponse({"detail": str(exc.detail)}, status=404)
+    contracts = {
+        contract.pk: contract
+        async for contract in index.window(today, days).filter(pk__in=page_ids)
+    }
+    rows = [contracts[pk] for pk in page_ids if pk in contracts]
+    serializer = ServiceContractSerializer(rows, many=True, context={"request": drf_request})
+    return JsonResponse(
+        {
+            "count": paginator.page.paginator.count,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+            "results": serializer.data,
+        }
+    )
+
+
+@require_safe
+@jwt_required
+async def expiring_services(request):
+    return await _window_feed(request, "expiry_date")
+
+
+@require_safe
+@jwt_required
+async def payment_due_services(request):
+    return await _window_feed(request, "payment_due_date")
@@ -0,0 +1,27 @@
+"""System checks for settings the app relies on."""
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.checks import Error, Tags, register
+
+# Backends whose entries are private to one worker process.
+PROCESS_LOCAL_CACHES = {"django.core.cache.backends.locmem.LocMemCache"}
+
+
+@register(Tags.caches)
+def check_window_bucket_cache(app_configs, **kwargs):
+    """The window bucket index is invalidated through the default cache."""
+
+    if not getattr(settings, "WINDOW_BUCKET_INDEX", False):
+        return []
+    backend = settings.CACHES.get(DEFAULT_CACHE_ALIAS, {}).get("BACKEND")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Error(
+            "WINDOW_BUCKET_INDEX needs a cache shared by all worker processes.",
+            hint="Set CACHE_URL to a Redis or Memcached server, or turn "
+            "WINDOW_BUCKET_INDEX off.",
+            obj="settings.WINDOW_BUCKET_INDEX",
+            id="main_app.E001",
+        )
+    ]
@@ -0,0 +1,123 @@
+"""Columnar reminder classification for large in-memory batches.
+
+Mirrors ``ReminderService._color_for`` / ``_dominant_color`` over whole columns of
+dates. NumPy is used when it is installed; otherwise the standard library
+``array`` module keeps the same API with compact typed storage.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import date
+
+try:  # pragma: no cover - exercised only when numpy is installed
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Codes double as priorities: the dominant color is the smallest code.
+COLOR_NAMES = ("red", "yellow", "green")
+RED, YELLOW, GREEN = range(3)
+
+
+@dataclass
+class BatchClassification:
+    days_until_expiry: object
+    days_until_payment: object
+    expiry_codes: object
+    payment_codes: object
+    dominant_codes: object
+
+    def __len__(self) -> int:
+        return len(self.dominant_codes)
+
+
+def color_names(codes) -> list[str]:
+    return [COLOR_NAMES[code] for code in codes]
+
+
+def color_totals(codes) -> dict[str, int]:
+    """Count codes per color name (``{"red": n, "yellow": n, "green": n}``)."""
+
+    if np is not None and isinstance(codes, np.ndarray):
+        counts = np.bincount(codes, minlength=len(COLOR_NAMES)).tolist()
+    else:
+        counts = [0] * len(COLOR_NAMES)
+        for code in codes:
+            counts[code] += 1
+    return dict(zip(COLOR_NAMES, counts))
+
+
+def _numpy_days(values, as_of: date):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return (values.astype("datetime64[D]") - np.datetime64(as_of, "D")).astype(np.int64)
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int64) - as_of.toordinal()
+    ordinals = np.fromiter((value.toordinal() for value in values), np.int64, len(values))
+    return ordinals - as_of.toordinal()
+
+
+def _numpy_codes(days, window_days: int):
+    return np.where(days < 0, RED, np.where(days <= window_days, YELLOW, GREEN)).astype(
+        np.int8
+    )
+
+
+def _array_days(values, as_of: date) -> array:
+    origin = as_of.toordinal()
+    return array(
+        "q",
+        (
+            (value if isinstance(value, int) else value.toordinal()) - origin
+            for value in values
+        ),
+    )
+
+
+def _array_codes(days: array, window_days: int) -> array:
+    return array(
+        "b",
+        (RED if day < 0 else YELLOW if day <= window_days else GREEN for day in days),
+    )
+
+
+def classify_batch(
+    expiry_dates,
+    payment_dates,
+    as_of: date,
+    window_days: int,
+    use_numpy: bool | None = None,
+) -> BatchClassification:
+    """Classify parallel columns of expiry/payment dates relative to ``as_of``.
+
+    Columns may hold ``date`` objects, ``datetime64`` values (NumPy only) or day
+    ordinals. ``use_numpy`` forces a backend; by default NumPy is used when
+    available.
+    """
+
+    if len(expiry_dates) != len(payment_dates):
+        raise ValueError("expiry_dates and payment_dates must have the same length")
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        if np is None:
+            raise ImportError("numpy is required for use_numpy=True")
+        expiry_days = _numpy_days(expiry_dates, as_of)
+        payment_days = _numpy_days(payment_dates, as_of)
+        expiry_codes = _numpy_codes(expiry_days, window_days)
+        payment_codes = _numpy_codes(payment_days, window_days)
+        dominant = np.minimum(expiry_codes, payment_codes)
+    else:
+        expiry_days = _array_days(expiry_dates, as_of)
+        payment_days = _array_days(payment_dates, as_of)
+        expiry_codes = _array_codes(expiry_days, window_days)
+        payment_codes = _array_codes(payment_days, window_days)
+        dominant = array("b", map(min, expiry_codes, payment_codes))
+    return BatchClassification(
+        days_until_expiry=expiry_days,
+        days_until_payment=payment_days,
+        expiry_codes=expiry_codes,
+        payment_codes=payment_codes,
+        dominant_codes=dominant,
+    )
@@ -0,0 +1,109 @@
+"""Single-flight coalescing of identical concurrent computations."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs ``fn`` once per key among concurrent callers in this process.
+
+    The first caller for a key computes the value; callers arriving while it
+    runs block and receive the same result (or exception). Nothing is cached
+    afterwards, so the next request after completion computes afresh.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def waiters(self, key: Hashable) -> int:
+        """Number of callers currently waiting on ``key``'s in-flight computation."""
+
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
+
+
+class AsyncSingleFlight:
+    """:class:`SingleFlight` for coroutines (async views).
+
+    The first awaiter for a key runs ``fn()``; awaiters on the same event loop
+    arriving meanwhile get the same result (or exception) without running it
+    again. Futures cannot be awaited from another loop, and under WSGI every
+    async request runs in its own loop, so calls are coalesced per loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        slot = (loop, key)
+        with self._lock:
+            call = self._calls.get(slot)
+            leader = call is None
+            if leader:
+                call = self._calls[slot] = loop.create_future()
+        if not leader:
+            # Shielded: a cancelled waiter must not cancel the leader's result.
+            return await asyncio.shield(call)
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as exc:
+            call.set_exception(exc)
+            # Mark it retrieved; the leader re-raises it even without waiters.
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[slot]
+        return result
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a computation for ``key`` is currently running on any loop."""
+
+        with self._lock:
+            return any(running == key for _, running in self._calls)
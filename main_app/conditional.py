@@ -0,0 +1,166 @@
+"""Conditional GET helpers (ETag / Last-Modified) for the polling endpoints."""
+from __future__ import annotations
+
+import hashlib
+from datetime import date, datetime, time
+
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from .models import ServiceContract, Tombstone, Vendor
+
+
+def queryset_version(queryset) -> tuple[datetime | None, int]:
+    """Return ``(max(updated_at), count)`` for ``queryset`` in a single query."""
+
+    data = queryset.order_by().aggregate(latest=Max("updated_at"), total=Count("pk"))
+    return data["latest"], data["total"]
+
+
+def latest_change(model, resource: str = "") -> datetime | None:
+    """Newest write to ``model``'s whole table, including deletes recorded as tombstones.
+
+    Filtered lists use this for ``Last-Modified``: their own ``max(updated_at)``
+    does not move when a row is deleted or edited out of the filter.
+    """
+
+    latest = model.objects.order_by().aggregate(latest=Max("updated_at"))["latest"]
+    if not resource:
+        return latest
+    # Queried on its own: once the last row is deleted, the table has nothing left
+    # to aggregate a tombstone subquery over.
+    deleted = Tombstone.objects.filter(resource=resource).aggregate(latest=Max("updated_at"))
+    return _newest(latest, deleted["latest"])
+
+
+def table_versions() -> list[tuple[datetime | None, int]]:
+    """Data version of every table that feeds the contract/reminder payloads."""
+
+    return [
+        queryset_version(ServiceContract.objects.all()),
+        queryset_version(Vendor.objects.all()),
+    ]
+
+
+def build_validators(*parts) -> tuple[str, datetime | None]:
+    """Hash ``parts`` into a strong ETag and pick the newest timestamp among them."""
+
+    digest = hashlib.md5(usedforsecurity=False)
+    latest: datetime | None = None
+    for part in parts:
+        digest.update(repr(part).encode())
+        for value in part if isinstance(part, (list, tuple)) else (part,):
+            if isinstance(value, datetime) and (latest is None or value > latest):
+                latest = value
+    return quote_etag(digest.hexdigest()), latest
+
+
+def _newest(*values: datetime | None) -> datetime | None:
+    return max((value for value in values if value is not None), default=None)
+
+
+def _timestamp(last_modified: datetime | None) -> int | None:
+    return int(last_modified.timestamp()) if last_modified else None
+
+
+def _attach_validators(response, etag: str, last_modified: datetime | None):
+    if 200 <= response.status_code < 300 or response.status_code == 304:
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(_timestamp(last_modified))
+    return response
+
+
+def conditional_response(request, etag: str, last_modified: datetime | None, render):
+    """Return 304 when the request validators match, otherwise call ``render()``.
+
+    ``render`` is only invoked when the client copy is stale, so serialization is
+    skipped entirely for unchanged resources. Both validators are attached to the
+    returned response.
+    """
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=_timestamp(last_modified)
+    )
+    if response is None:
+        response = render()
+    return _attach_validators(response, etag, last_modified)
+
+
+async def aconditional_response(request, etag: str, last_modified: datetime | None, render):
+    """:func:`conditional_response` for async views; ``render`` is a coroutine function."""
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=_timestamp(last_modified)
+    )
+    if response is None:
+        response = await render()
+    return _attach_validators(response, etag, last_modified)
+
+
+class ConditionalGetMixin:
+    """Adds ETag/Last-Modified handling to ``list`` and ``retrieve`` of a viewset.
+
+    The list ETag hashes ``max(updated_at)`` and ``count`` of the filtered queryset
+    (plus the request's query string, so pages and filters get distinct tags);
+    its ``Last-Modified`` is the table-wide :func:`latest_change`, so deletes and
+    rows leaving the filter still count as modifications. Detail validators use
+    the row's own ``updated_at``. Subclasses extend these through
+    :meth:`get_list_version_parts`, :meth:`get_list_last_modified` and
+    :meth:`get_detail_version_parts`.
+    """
+
+    change_resource: str = ""
+
+    def get_list_version_parts(self, queryset) -> list:
+        return [queryset_version(queryset)]
+
+    def get_list_last_modified(self, queryset) -> list[datetime | None]:
+        return [latest_change(queryset.model, self.change_resource)]
+
+    def get_detail_version_parts(self, instance) -> list:
+        return [instance.updated_at]
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        etag, last_modified = build_validators(
+            request.META.get("QUERY_STRING", ""),
+            *self.get_list_version_parts(queryset),
+        )
+        last_modified = _newest(last_modified, *self.get_list_last_modified(queryset))
+        return conditional_response(
+            request,
+            etag,
+            last_modified,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag, last_modified = build_validators(
+            instance.pk, *self.get_detail_version_parts(instance)
+        )
+        return conditional_response(
+            request,
+            etag,
+            last_modified,
+            lambda: self._render_detail(instance),
+        )
+
+    def _render_detail(self, instance):
+        return Response(self.get_serializer(instance).data)
+
+
+def report_validators(today: date, window_days: int) -> tuple[str, datetime | None]:
+    """Validators for reminder feeds: the day, the window and the data version.
+
+    ``Last-Modified`` never predates midnight of ``today`` because day deltas and
+    colors change when the date rolls over even if no row was touched.
+    """
+
+    etag, latest = build_validators(today.isoformat(), window_days, *table_versions())
+    day_start = timezone.make_aware(datetime.combine(today, time.min))
+    return etag, max(latest, day_start) if latest else day_start
@@ -0,0 +1,92 @@
+"""Query-parameter filters for the service contract endpoints."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+
+from .models import ServiceStatus
+
+MAX_WINDOW_DAYS = 366
+DEFAULT_WINDOW_DAYS = 15
+
+
+class ServiceContractFilterSerializer(serializers.Serializer):
+    """Validates the contract list filters; every parameter is optional."""
+
+    vendor = serializers.IntegerField(required=False, min_value=1)
+    status = serializers.CharField(required=False)
+    expiry_after = serializers.DateField(required=False)
+    expiry_before = serializers.DateField(required=False)
+    payment_due_after = serializers.DateField(required=False)
+    payment_due_before = serializers.DateField(required=False)
+    amount_min = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    amount_max = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    expiring_within = serializers.IntegerField(
+        required=False, min_value=0, max_value=MAX_WINDOW_DAYS
+    )
+    payment_due_within = serializers.IntegerField(
+        required=False, min_value=0, max_value=MAX_WINDOW_DAYS
+    )
+
+    def validate_status(self, value: str) -> list[str]:
+        statuses = [item.strip().upper() for item in value.split(",") if item.strip()]
+        invalid = sorted(set(statuses) - set(ServiceStatus.values))
+        if invalid:
+            raise serializers.ValidationError(f"Unknown status: {', '.join(invalid)}.")
+        return statuses
+
+
+class WindowParamsSerializer(serializers.Serializer):
+    """``?days=`` horizon for the expiring / payment-due feeds."""
+
+    days = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        max_value=MAX_WINDOW_DAYS,
+        default=DEFAULT_WINDOW_DAYS,
+    )
+
+
+class ServiceContractFilterBackend(BaseFilterBackend):
+    """Applies :class:`ServiceContractFilterSerializer` filters to a queryset.
+
+    ``expiring_within``/``payment_due_within`` select contracts whose date falls
+    between today and ``today + N`` days, mirroring the dedicated window feeds.
+    """
+
+    range_filters = {
+        "expiry_after": "expiry_date__gte",
+        "expiry_before": "expiry_date__lte",
+        "payment_due_after": "payment_due_date__gte",
+        "payment_due_before": "payment_due_date__lte",
+        "amount_min": "amount__gte",
+        "amount_max": "amount__lte",
+    }
+    window_filters = {
+        "expiring_within": "expiry_date",
+        "payment_due_within": "payment_due_date",
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        params = ServiceContractFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        lookups = {}
+        if "vendor" in data:
+            lookups["vendor_id"] = data["vendor"]
+        if "status" in data:
+            lookups["status__in"] = data["status"]
+        for param, lookup in self.range_filters.items():
+            if param in data:
+                lookups[lookup] = data[param]
+        today = timezone.localdate()
+        for param, field_name in self.window_filters.items():
+            if param in data:
+                lookups[f"{field_name}__gte"] = today
+                lookups[f"{field_name}__lte"] = today + timedelta(days=data[param])
+        return queryset.filter(**lookups) if lookups else queryset
+
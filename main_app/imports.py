@@ -0,0 +1,237 @@
+"""Bulk import of vendors and service contracts from CSV or NDJSON files.
+
+Rows are streamed from the file and handled ``chunk_size`` at a time: a chunk is
+validated, the vendors it describes are upserted on ``email`` and every vendor
+it references is resolved with one ``email__in`` lookup, then its contracts are
+upserted on ``ServiceContract.import_key`` with ``bulk_create(update_conflicts=True)``.
+A row's key is its ``import_key`` column, by default ``<vendor_email>:<service_name>``,
+so re-importing a file updates the contracts it created. Invalid rows are reported
+with their line number and skipped; the rest of the file is still imported. Bulk
+writes bypass the search signals, so each chunk re-indexes the rows it touched.
+"""
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import PurePath
+
+from django.db import transaction
+from rest_framework import serializers
+
+from .models import ServiceContract, ServiceStatus, Vendor, VendorStatus
+from .search import KIND_SERVICE, KIND_VENDOR, get_search_backend
+from .windows import invalidate_all as invalidate_window_buckets
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+FORMATS = (FORMAT_CSV, FORMAT_NDJSON)
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+VENDOR_UPDATE_FIELDS = ["name", "contact_person", "phone", "status", "updated_at"]
+CONTRACT_UPDATE_FIELDS = [
+    "vendor",
+    "service_name",
+    "start_date",
+    "expiry_date",
+    "payment_due_date",
+    "amount",
+    "status",
+    "vendor_name",
+    "vendor_email",
+    "updated_at",
+]
+
+
+class ContractImportRowSerializer(serializers.Serializer):
+    """One import row: a contract plus the vendor it belongs to.
+
+    ``vendor_email`` identifies the vendor. Rows that also carry ``vendor_name``
+    create or update that vendor; otherwise the vendor must already exist.
+    """
+
+    vendor_email = serializers.EmailField()
+    vendor_name = serializers.CharField(max_length=255, required=False)
+    vendor_contact_person = serializers.CharField(max_length=255, required=False)
+    vendor_phone = serializers.CharField(max_length=30, required=False)
+    vendor_status = serializers.ChoiceField(choices=VendorStatus.choices, required=False)
+    import_key = serializers.CharField(max_length=512, required=False)
+    service_name = serializers.CharField(max_length=255)
+    start_date = serializers.DateField()
+    expiry_date = serializers.DateField()
+    payment_due_date = serializers.DateField()
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    status = serializers.ChoiceField(choices=ServiceStatus.choices, default=ServiceStatus.ACTIVE)
+
+    def validate(self, data):
+        if "vendor_name" in data:
+            missing = [
+                name for name in ("vendor_contact_person", "vendor_phone") if name not in data
+            ]
+            if missing:
+                raise serializers.ValidationError(
+                    {name: "Required when vendor_name is given." for name in missing}
+                )
+        data.setdefault("import_key", f"{data['vendor_email']}:{data['service_name']}")
+        return data
+
+
+def detect_format(filename: str | None) -> str:
+    """``ndjson`` for ``.ndjson``/``.jsonl`` files, ``csv`` otherwise."""
+
+    suffix = PurePath(filename or "").suffix.lower()
+    return FORMAT_NDJSON if suffix in NDJSON_SUFFIXES else FORMAT_CSV
+
+
+def read_rows(stream, file_format: str) -> Iterator[tuple[int, object]]:
+    """Yield ``(line_number, row)`` from a text stream without loading it whole.
+
+    CSV rows drop empty cells so optional columns can be left blank. A line that
+    is not valid JSON yields the ``ValueError`` in place of the row.
+    """
+
+    if file_format == FORMAT_CSV:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {
+                key: value.strip()
+                for key, value in row.items()
+                if key is not None and value and value.strip()
+            }
+        return
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as exc:
+            yield line_number, exc
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    imported: int = 0
+    vendors: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, line: int, errors) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "errors": errors})
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "imported": self.imported,
+            "vendors": self.vendors,
+            "failed": self.failed,
+            "errors": self.errors,
+        }
+
+
+class ContractImporter:
+    """Upserts streamed import rows chunk by chunk; see the module docstring."""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+
+    def run(self, rows: Iterable[tuple[int, object]]) -> ImportResult:
+        result = ImportResult()
+        rows = iter(rows)
+        while chunk := list(islice(rows, self.chunk_size)):
+            result.rows += len(chunk)
+            self._import_chunk(chunk, result)
+        return result
+
+    def import_file(self, stream, file_format: str) -> ImportResult:
+        return self.run(read_rows(stream, file_format))
+
+    def _import_chunk(self, chunk, result: ImportResult) -> None:
+        valid = []
+        for line, data in chunk:
+            if isinstance(data, ValueError):
+                result.add_error(line, {"non_field_errors": [f"Invalid JSON: {data}"]})
+                continue
+            serializer = ContractImportRowSerializer(data=data)
+            if serializer.is_valid():
+                valid.append((line, serializer.validated_data))
+            else:
+                result.add_error(line, serializer.errors)
+        if not valid:
+            return
+
+        # Later rows for the same vendor or contract win, as if applied in order.
+        vendors = {
+            row["vendor_email"]: Vendor(
+                email=row["vendor_email"],
+                name=row["vendor_name"],
+                contact_person=row["vendor_contact_person"],
+                phone=row["vendor_phone"],
+                status=row.get("vendor_status", VendorStatus.ACTIVE),
+            )
+            for _, row in valid
+            if "vendor_name" in row
+        }
+        with transaction.atomic():
+            if vendors:
+                Vendor.objects.bulk_create(
+                    vendors.values(),
+                    update_conflicts=True,
+                    unique_fields=["email"],
+                    update_fields=VENDOR_UPDATE_FIELDS,
+                )
+                result.vendors += len(vendors)
+            known = {
+                email: (pk, name)
+                for email, pk, name in Vendor.objects.filter(
+                    email__in={row["vendor_email"] for _, row in valid}
+                ).values_list("email", "pk", "name")
+            }
+            vendor_ids = [known[email][0] for email in vendors]
+            if vendor_ids:
+                # Upserted vendors may have been renamed; refresh their other contracts.
+                ServiceContract.sync_vendor_fields(vendor_ids)
+            contracts = {}
+            for line, row in valid:
+                vendor_id, vendor_name = known.get(row["vendor_email"], (None, ""))
+                if vendor_id is None:
+                    result.add_error(
+                        line,
+                        {"vendor_email": ["Unknown vendor; include vendor_name to create it."]},
+                    )
+                    continue
+                contracts[row["import_key"]] = ServiceContract(
+                    import_key=row["import_key"],
+                    vendor_id=vendor_id,
+                    vendor_name=vendor_name,
+                    vendor_email=row["vendor_email"],
+                    service_name=row["service_name"],
+                    start_date=row["start_date"],
+                    expiry_date=row["expiry_date"],
+                    payment_due_date=row["payment_due_date"],
+                    amount=row["amount"],
+                    status=row["status"],
+                )
+            if contracts:
+                ServiceContract.objects.bulk_create(
+                    contracts.values(),
+                    update_conflicts=True,
+                    unique_fields=["import_key"],
+                    update_fields=CONTRACT_UPDATE_FIELDS,
+                )
+                result.imported += len(contracts)
+            # Bulk writes skip the signals that keep search and window caches current,
+            # so only the rows of this chunk are re-indexed.
+            search = get_search_backend()
+            search.index_ids(KIND_VENDOR, vendor_ids)
+            if contracts:
+                touched = ServiceContract.objects.filter(import_key__in=contracts.keys())
+                search.index_ids(KIND_SERVICE, touched.values_list("pk", flat=True))
+        if contracts:
+            invalidate_window_buckets()
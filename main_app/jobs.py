@@ -0,0 +1,118 @@
+"""Background reminder dispatch jobs started from the admin.
+
+Jobs run in a daemon thread of the web worker and save their progress after
+every batch. A restart or deploy stops that thread and leaves the job
+``PENDING`` or ``RUNNING``; the ``run_reminder_jobs`` command resumes such stale
+jobs from ``processed`` (or fails them).
+"""
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta
+
+from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.utils import timezone
+
+from .mail import close_thread_connections
+from .models import EmailLog, ReminderJob, ReminderJobStatus, ServiceContract
+from .reminders import ReminderService
+
+UNFINISHED_STATUSES = [ReminderJobStatus.PENDING, ReminderJobStatus.RUNNING]
+
+
+def start_reminder_job(job: ReminderJob) -> None:
+    """Run ``job`` in a daemon thread once the transaction creating it commits."""
+
+    transaction.on_commit(
+        lambda: threading.Thread(
+            target=run_reminder_job, args=(job.pk,), name=f"reminder-job-{job.pk}", daemon=True
+        ).start()
+    )
+
+
+def run_reminder_job(job_id: int, checkpoint: datetime | None = None) -> ReminderJob:
+    """Send reminders for the job's contracts in batches, saving progress after each.
+
+    ``checkpoint`` is the time progress was last saved by an interrupted run:
+    contracts of the next batch logged since then were already emailed and are
+    not sent again.
+    """
+
+    try:
+        job = ReminderJob.objects.get(pk=job_id)
+        job.status = ReminderJobStatus.RUNNING
+        job.save(update_fields=["status", "updated_at"])
+        service = ReminderService(using=DEFAULT_DB_ALIAS)
+        batch_size = service.email_batch_size
+        try:
+            for offset in range(job.processed, len(job.contract_ids), batch_size):
+                batch = job.contract_ids[offset : offset + batch_size]
+                contracts = ServiceContract.objects.filter(pk__in=batch)
+                if checkpoint is not None:
+                    logged = set(
+                        EmailLog.objects.filter(
+                            contract_id__in=batch, created_at__gte=checkpoint
+                        ).values_list("contract_id", flat=True)
+                    )
+                    contracts = contracts.exclude(pk__in=logged)
+                    job.sent += len(logged)
+                    checkpoint = None
+                payloads = service.send_notification_emails(contracts)
+                job.processed = offset + len(batch)
+                job.sent += len(payloads)
+                job.save(update_fields=["processed", "sent", "updated_at"])
+        except Exception as exc:
+            job.status = ReminderJobStatus.FAILED
+            job.error_message = str(exc)
+        else:
+            job.status = ReminderJobStatus.DONE
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "error_message", "finished_at", "updated_at"])
+        return job
+    finally:
+        if threading.current_thread() is not threading.main_thread():
+            connection.close()
+            close_thread_connections()
+
+
+def stale_jobs(stale_after: timedelta):
+    """Unfinished jobs whose progress has not been saved for ``stale_after``."""
+
+    cutoff = timezone.now() - stale_after
+    return ReminderJob.objects.filter(
+        status__in=UNFINISHED_STATUSES, updated_at__lt=cutoff
+    ).order_by("pk")
+
+
+def _claim(job: ReminderJob) -> bool:
+    # Only the runner whose update matches the stale timestamp takes the job over.
+    return bool(
+        ReminderJob.objects.filter(pk=job.pk, updated_at=job.updated_at).update(
+            updated_at=timezone.now()
+        )
+    )
+
+
+def resume_stale_jobs(stale_after: timedelta) -> list[ReminderJob]:
+    """Resume every stale job from its saved progress, in this thread."""
+
+    resumed = []
+    for job in stale_jobs(stale_after):
+        if _claim(job):
+            interrupted = job.status == ReminderJobStatus.RUNNING
+            resumed.append(run_reminder_job(job.pk, job.updated_at if interrupted else None))
+    return resumed
+
+
+def fail_stale_jobs(stale_after: timedelta) -> list[ReminderJob]:
+    """Mark every stale job failed, keeping the progress it saved."""
+
+    failed = []
+    for job in stale_jobs(stale_after):
+        if _claim(job):
+            job.status = ReminderJobStatus.FAILED
+            job.error_message = "Interrupted; not resumed."
+            job.finished_at = timezone.now()
+            job.save(update_fields=["status", "error_message", "finished_at", "updated_at"])
+            failed.append(job)
+    return failed
@@ -0,0 +1,267 @@
+"""SMTP credential selection and warm connections for reminder dispatch.
+
+Credentials rarely change, so the active rows are read once per process (and at
+most every ``CREDENTIAL_CACHE_TIMEOUT`` seconds, which bounds staleness in other
+worker processes). SMTP backends are kept open between dispatches, per thread and
+credential version, so a background job never shares or closes a session another
+thread is sending on. ``post_save``/``post_delete`` on ``EmailCredential`` clear
+both caches; each thread closes its outdated connections on its next dispatch.
+
+:class:`MailDispatcher` sends through the newest active credential, or in
+balanced mode spreads messages over every active credential by weight, failing
+over to the next one when a relay cannot be reached. Unreachable relays are
+skipped for an exponentially growing cool-down (a per-credential circuit breaker).
+"""
+from __future__ import annotations
+
+import smtplib
+import threading
+import time
+
+from django.conf import settings
+from django.core.mail import get_connection
+
+from .models import EmailCredential
+
+SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+CREDENTIAL_CACHE_TIMEOUT = 300
+DISPATCH_SINGLE = "single"
+DISPATCH_BALANCED = "balanced"
+BREAKER_BASE_SECONDS = 30
+BREAKER_MAX_SECONDS = 600
+# Rejections of one message; the relay itself works, so there is no failover.
+MESSAGE_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError)
+
+_lock = threading.Lock()
+_generation = 0
+_active: dict = {}
+_breakers: dict[tuple, "CircuitBreaker"] = {}
+# Per-thread ``connections`` ({credential version: backend}) and their ``generation``.
+_local = threading.local()
+
+
+def credential_version(credential: EmailCredential) -> tuple:
+    return credential.pk, credential.updated_at
+
+
+def get_active_credentials() -> list[EmailCredential]:
+    """Cached :meth:`EmailCredential.get_all_active`, newest first."""
+
+    with _lock:
+        generation = _generation
+        if _active and time.monotonic() < _active["expires"]:
+            return _active["credentials"]
+    credentials = EmailCredential.get_all_active()
+    with _lock:
+        # Skip storing rows read before a concurrent invalidation.
+        if generation == _generation:
+            _active.update(
+                credentials=credentials, expires=time.monotonic() + CREDENTIAL_CACHE_TIMEOUT
+            )
+    return credentials
+
+
+def get_active_credential() -> EmailCredential | None:
+    """Cached :meth:`EmailCredential.get_active`."""
+
+    credentials = get_active_credentials()
+    return credentials[0] if credentials else None
+
+
+def _thread_connections() -> dict:
+    connections = getattr(_local, "connections", None)
+    if connections is None or _local.generation != _generation:
+        close_thread_connections()
+        connections = _local.connections = {}
+        _local.generation = _generation
+    return connections
+
+
+def get_smtp_connection(credential: EmailCredential):
+    """Open-on-demand SMTP backend for ``credential``, reused by this thread.
+
+    The backend is opened by the caller and intentionally not closed, so later
+    dispatches on the same thread reuse the TLS session. Backends are never
+    shared between threads. Call :func:`drop_if_stale` before relying on a
+    session that may have been idle.
+    """
+
+    connections = _thread_connections()
+    key = credential_version(credential)
+    backend = connections.get(key)
+    if backend is None:
+        backend = connections[key] = get_connection(
+            backend=SMTP_BACKEND,
+            host=credential.smtp_host,
+            port=credential.smtp_port,
+            username=credential.username or None,
+            password=credential.password or None,
+            use_tls=credential.use_tls,
+            use_ssl=credential.use_ssl,
+        )
+    return backend
+
+
+def drop_if_stale(backend) -> None:
+    """Close ``backend`` if the server dropped its session (checked with ``NOOP``)."""
+
+    if getattr(backend, "connection", None) is None:
+        return
+    try:
+        status = backend.connection.noop()[0]
+    except (smtplib.SMTPException, OSError):
+        status = None
+    if status != 250:
+        backend.close()
+
+
+def close_thread_connections() -> None:
+    """Close the calling thread's pooled SMTP connections (e.g. when a job thread ends)."""
+
+    for backend in (getattr(_local, "connections", None) or {}).values():
+        backend.close()
+    _local.connections = None
+
+
+def describe_error(exc: BaseException) -> str:
+    """``str(exc)``, or the exception class name for errors raised without a message."""
+
+    return str(exc) or type(exc).__name__
+
+
+def invalidate_credentials() -> None:
+    """Forget cached credentials and breakers; pooled connections are replaced lazily."""
+
+    global _generation
+    with _lock:
+        _generation += 1
+        _active.clear()
+        _breakers.clear()
+    close_thread_connections()
+
+
+class CircuitBreaker:
+    """Skips a failing credential for ``base * 2**(failures - 1)`` seconds (capped)."""
+
+    def __init__(self):
+        self.failures = 0
+        self.open_until = 0.0
+
+    def available(self, now: float | None = None) -> bool:
+        return (time.monotonic() if now is None else now) >= self.open_until
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        delay = min(BREAKER_BASE_SECONDS * 2 ** (self.failures - 1), BREAKER_MAX_SECONDS)
+        self.open_until = time.monotonic() + delay
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.open_until = 0.0
+
+
+def breaker_for(credential: EmailCredential) -> CircuitBreaker:
+    with _lock:
+        return _breakers.setdefault(credential_version(credential), CircuitBreaker())
+
+
+class CredentialBalancer:
+    """Smooth weighted round-robin over the credentials whose breaker is closed."""
+
+    def __init__(self, credentials: list[EmailCredential]):
+        self.credentials = credentials
+        self._current = {credential.pk: 0 for credential in credentials}
+
+    def candidates(self) -> list[EmailCredential]:
+        """Credentials to try for one message: the round-robin pick, then failovers.
+
+        When every breaker is open, all credentials are returned, soonest to
+        recover first, so mail is still attempted rather than dropped.
+        """
+
+        now = time.monotonic()
+        available = [c for c in self.credentials if breaker_for(c).available(now)]
+        if not available:
+            return sorted(self.credentials, key=lambda c: breaker_for(c).open_until)
+        total = sum(credential.weight for credential in available)
+        for credential in available:
+            self._current[credential.pk] += credential.weight
+        chosen = max(available, key=lambda credential: self._current[credential.pk])
+        self._current[chosen.pk] -= total
+        failovers = sorted(
+            (credential for credential in available if credential is not chosen),
+            key=lambda credential: -credential.weight,
+        )
+        return [chosen, *failovers]
+
+
+class MailDispatcher:
+    """Sends messages for one reminder run and reports which credential was used."""
+
+    def __init__(self, credentials: list[EmailCredential]):
+        self.balancer = CredentialBalancer(credentials) if credentials else None
+        # Pooled sessions are checked for staleness once per dispatcher, not per message.
+        self._checked: set[int] = set()
+        # Without credentials the configured EMAIL_BACKEND is used for this run only.
+        self._fallback = None if credentials else get_connection()
+
+    @classmethod
+    def for_mode(cls, mode: str | None = None) -> "MailDispatcher":
+        mode = mode or getattr(settings, "REMINDER_EMAIL_DISPATCH", DISPATCH_SINGLE)
+        if mode == DISPATCH_BALANCED:
+            credentials = get_active_credentials()
+            # Weight only shares out balanced dispatch; with no positive weight,
+            # fall back to the newest credential rather than EMAIL_BACKEND.
+            return cls([c for c in credentials if c.weight > 0] or credentials[:1])
+        credential = get_active_credential()
+        return cls([credential] if credential else [])
+
+    def __enter__(self):
+        if self._fallback is not None:
+            self._fallback.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._fallback is not None:
+            self._fallback.close()
+
+    def send(self, message) -> tuple[EmailCredential | None, bool, str]:
+        """Send ``message``; return ``(credential, sent, error_message)``.
+
+        ``sent`` is the outcome; ``error_message`` describes a failure and is
+        ``""`` on success.
+        """
+
+        if self.balancer is None:
+            message.from_email = message.from_email or settings.DEFAULT_FROM_EMAIL
+            message.connection = self._fallback
+            try:
+                message.send(fail_silently=False)
+            except Exception as exc:  # pragma: no cover - network failures are rare
+                return None, False, describe_error(exc)
+            return None, True, ""
+
+        credential, error = None, "No SMTP credential accepted the message."
+        for credential in self.balancer.candidates():
+            connection = get_smtp_connection(credential)
+            if credential.pk not in self._checked:
+                self._checked.add(credential.pk)
+                drop_if_stale(connection)
+            message.from_email = credential.from_email
+            message.connection = connection
+            try:
+                connection.open()
+                message.send(fail_silently=False)
+            except MESSAGE_ERRORS as exc:
+                return credential, False, describe_error(exc)
+            except OSError as exc:
+                # Relay unreachable or session broken: trip the breaker, try the next one.
+                breaker_for(credential).record_failure()
+                connection.close()
+                error = describe_error(exc)
+                continue
+            except Exception as exc:  # pragma: no cover - malformed message
+                return credential, False, describe_error(exc)
+            breaker_for(credential).record_success()
+            return credential, True, ""
+        return credential, False, error
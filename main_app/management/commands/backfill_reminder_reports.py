@@ -0,0 +1,33 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from ...models import ReminderSnapshot
+from ...reminders import build_daily_reports
+
+
+class Command(BaseCommand):
+    help = "Recompute daily reminder report totals for a date range and store snapshots."
+    # Batch command: skip the URL/admin system checks (see core_project/batch_settings.py).
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", type=date.fromisoformat, required=True)
+        parser.add_argument(
+            "--end",
+            type=date.fromisoformat,
+            help="Last day to compute (defaults to today).",
+        )
+        parser.add_argument("--window", type=int, default=15, help="Reminder window in days.")
+
+    def handle(self, *args, **options):
+        end = options["end"] or timezone.localdate()
+        try:
+            reports = build_daily_reports(options["start"], end, options["window"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        stored = ReminderSnapshot.store(reports)
+        self.stdout.write(
+            self.style.SUCCESS(f"Stored {stored} snapshot(s) from {options['start']} to {end}")
+        )
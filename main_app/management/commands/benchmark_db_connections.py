@@ -0,0 +1,85 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.db.backends.signals import connection_created
+from rest_framework.test import APIClient
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure API throughput under concurrent load with per-request versus "
+        "persistent database connections on the configured database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=400)
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--path", default="/api/vendors/")
+        parser.add_argument("--persistent-age", type=int, default=600)
+
+    def handle(self, *args, **options):
+        # An unsaved user authenticates without touching the database, so the
+        # measured queries are only those of the endpoint itself.
+        user = get_user_model()(username="benchmark")
+        db_settings = connections.settings[DEFAULT_DB_ALIAS]
+        original_age = db_settings["CONN_MAX_AGE"]
+        try:
+            for mode, max_age in (("per_request", 0), ("persistent", options["persistent_age"])):
+                db_settings["CONN_MAX_AGE"] = max_age
+                result = self._run(user, options)
+                result.update({"mode": mode, "engine": db_settings["ENGINE"]})
+                self.stdout.write(json.dumps(result))
+        finally:
+            db_settings["CONN_MAX_AGE"] = original_age
+
+    def _run(self, user, options) -> dict:
+        opened = 0
+        lock = threading.Lock()
+
+        def count_connection(sender, connection, **kwargs):
+            nonlocal opened
+            if connection.alias == DEFAULT_DB_ALIAS:
+                with lock:
+                    opened += 1
+
+        def worker(count: int) -> int:
+            client = APIClient()
+            client.force_authenticate(user=user)
+            failures = 0
+            try:
+                for _ in range(count):
+                    # The test client disconnects Django's request_started/finished
+                    # handlers, so apply CONN_MAX_AGE around each request here.
+                    close_old_connections()
+                    if client.get(options["path"]).status_code != 200:
+                        failures += 1
+                    close_old_connections()
+            finally:
+                connections.close_all()
+            return failures
+
+        threads = options["threads"]
+        share, remainder = divmod(options["requests"], threads)
+        batches = [share + (1 if index < remainder else 0) for index in range(threads)]
+        connection_created.connect(count_connection)
+        try:
+            started = time.perf_counter()
+            # A fresh pool per run gives every mode brand-new thread-local connections.
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                failures = sum(pool.map(worker, batches))
+            elapsed = time.perf_counter() - started
+        finally:
+            connection_created.disconnect(count_connection)
+        return {
+            "requests": options["requests"],
+            "threads": threads,
+            "failures": failures,
+            "connections_opened": opened,
+            "seconds": round(elapsed, 3),
+            "requests_per_second": round(options["requests"] / elapsed, 1),
+        }
@@ -0,0 +1,43 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...imports import DEFAULT_CHUNK_SIZE, FORMATS, ContractImporter, detect_format
+
+
+class Command(BaseCommand):
+    help = "Upsert vendors and service contracts from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - to read standard input.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="File format (defaults to ndjson for .ndjson/.jsonl files, csv otherwise).",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per batch."
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or detect_format(path)
+        importer = ContractImporter(chunk_size=options["chunk_size"])
+        if path == "-":
+            result = importer.import_file(sys.stdin, file_format)
+        else:
+            try:
+                with open(path, newline="", encoding="utf-8-sig") as stream:
+                    result = importer.import_file(stream, file_format)
+            except OSError as exc:
+                raise CommandError(str(exc)) from exc
+        for error in result.errors:
+            self.stderr.write(f"Line {error['line']}: {error['errors']}")
+        if result.failed > len(result.errors):
+            self.stderr.write(f"... {result.failed - len(result.errors)} more invalid row(s)")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.imported} contract(s) and {result.vendors} vendor(s) "
+                f"from {result.rows} row(s); {result.failed} row(s) failed"
+            )
+        )
@@ -0,0 +1,243 @@
+import json
+import statistics
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ...imports import ContractImporter
+from ...models import EmailLog, ServiceContract
+
+# (name, URL name, query parameters) of the read endpoints under test.
+ENDPOINTS = (
+    ("vendors", "vendor-list", {}),
+    ("services", "service-list", {}),
+    ("services_expiring", "services-expiring", {"days": 30}),
+    ("services_payment_due", "services-payment-due", {"days": 30}),
+    ("reminders", "services-reminders", {}),
+    ("reminder_report", "services-reminders-report", {}),
+    ("email_logs", "services-reminders-email-logs", {}),
+)
+SEED_DOMAIN = "loadtest.example.com"
+
+
+def percentile(quantiles: list[float], value: int) -> float:
+    return round(quantiles[value - 1], 2)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed load-test data and measure latency percentiles, throughput and query "
+        "counts of the read API endpoints under concurrent authenticated requests. "
+        "Prints one JSON document for comparison across commits."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint.")
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="Untimed requests per thread and endpoint."
+        )
+        parser.add_argument("--vendors", type=int, default=50, help="Vendors to seed.")
+        parser.add_argument("--contracts-per-vendor", type=int, default=20)
+        parser.add_argument("--no-seed", action="store_true", help="Use the existing data.")
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            choices=[name for name, _, _ in ENDPOINTS],
+            help="Endpoint to test (repeatable; defaults to all).",
+        )
+        parser.add_argument(
+            "--base-url",
+            help="Send HTTP requests to a running server (e.g. http://127.0.0.1:8000) "
+            "instead of the in-process APIClient; query counts are then not reported. "
+            "Start that server with API_THROTTLING=off, or the reminder endpoints "
+            "answer most requests with 429.",
+        )
+        parser.add_argument("--output", help="Also write the JSON report to this file.")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["threads"] < 1:
+            raise CommandError("--requests and --threads must be positive.")
+        if not options["no_seed"]:
+            self._seed(options["vendors"], options["contracts_per_vendor"])
+        user, _ = get_user_model().objects.get_or_create(username="loadtest")
+        token = str(RefreshToken.for_user(user).access_token)
+
+        selected = options["endpoint"] or [name for name, _, _ in ENDPOINTS]
+        report = {
+            "commit": self._commit(),
+            "mode": "http" if options["base_url"] else "in_process",
+            "database": connection.vendor,
+            "requests_per_endpoint": options["requests"],
+            "threads": options["threads"],
+            "endpoints": {},
+        }
+        # Throttles would turn most of the load into 429s. In-process runs switch them
+        # off here; over HTTP only the server's own API_THROTTLING setting counts.
+        with override_settings(API_THROTTLING=False):
+            for name, url_name, params in ENDPOINTS:
+                if name in selected:
+                    path = reverse(url_name)
+                    report["endpoints"][name] = self._measure(path, params, token, options)
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                handle.write(output + "\n")
+        self.stdout.write(output)
+
+    def _seed(self, vendors: int, contracts_per_vendor: int) -> None:
+        """Upsert a deterministic data set spread around today (idempotent)."""
+
+        today = timezone.localdate()
+
+        def rows():
+            line = 0
+            for vendor in range(vendors):
+                for contract in range(contracts_per_vendor):
+                    line += 1
+                    offset = (vendor * contracts_per_vendor + contract) % 150 - 30
+                    yield line, {
+                        "vendor_email": f"vendor{vendor}@{SEED_DOMAIN}",
+                        "vendor_name": f"Load Vendor {vendor}",
+                        "vendor_contact_person": f"Contact {vendor}",
+                        "vendor_phone": f"555-{vendor:04d}",
+                        "service_name": f"Load Service {contract}",
+                        "start_date": (today - timedelta(days=365)).isoformat(),
+                        "expiry_date": (today + timedelta(days=offset)).isoformat(),
+                        "payment_due_date": (today + timedelta(days=offset // 2)).isoformat(),
+                        "amount": f"{100 + contract}.00",
+                    }
+
+        result = ContractImporter().run(rows())
+        contracts = ServiceContract.objects.filter(vendor_email__endswith=f"@{SEED_DOMAIN}")
+        if not EmailLog.objects.filter(contract__in=contracts).exists():
+            EmailLog.objects.bulk_create(
+                EmailLog(
+                    contract_id=contract_id,
+                    recipient=email,
+                    sender=settings.DEFAULT_FROM_EMAIL,
+                    subject="Contract reminder",
+                    body="Load-test reminder",
+                    success=True,
+                )
+                for contract_id, email in contracts.values_list("pk", "vendor_email")
+            )
+        self.stderr.write(f"Seeded {result.imported} contract(s) for {result.vendors} vendor(s)")
+
+    def _measure(self, path: str, params: dict, token: str, options) -> dict:
+        send = self._http_sender if options["base_url"] else self._client_sender
+        threads = min(options["threads"], options["requests"])
+        # Every thread warms up first, so the timed window starts with all of them ready.
+        ready = threading.Barrier(threads)
+
+        def worker(count: int):
+            request = send(path, params, token, options["base_url"])
+            for _ in range(options["warmup"]):
+                request()
+            ready.wait()
+            started = time.perf_counter()
+            timings, failures, queries = [], 0, 0
+            for _ in range(count):
+                sent = time.perf_counter()
+                status, executed = request()
+                timings.append((time.perf_counter() - sent) * 1000)
+                failures += status != 200
+                queries += executed or 0
+            return timings, failures, queries, started, time.perf_counter()
+
+        def pooled_worker(count: int):
+            try:
+                return worker(count)
+            finally:
+                connections.close_all()
+
+        share, remainder = divmod(options["requests"], threads)
+        batches = [share + (1 if index < remainder else 0) for index in range(threads)]
+        if threads == 1:
+            # Inline, so the caller's connection (and transaction) is used.
+            results = [worker(batches[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                results = list(pool.map(pooled_worker, batches))
+        elapsed = max(result[4] for result in results) - min(result[3] for result in results)
+
+        timings = [timing for result in results for timing in result[0]]
+        if len(timings) > 1:
+            quantiles = statistics.quantiles(timings, n=100, method="inclusive")
+        else:
+            quantiles = timings * 99
+        return {
+            "path": path,
+            "requests": len(timings),
+            "failures": sum(result[1] for result in results),
+            "p50_ms": percentile(quantiles, 50),
+            "p95_ms": percentile(quantiles, 95),
+            "p99_ms": percentile(quantiles, 99),
+            "mean_ms": round(statistics.fmean(timings), 2),
+            "requests_per_second": round(len(timings) / elapsed, 1),
+            "queries_per_request": (
+                None
+                if options["base_url"]
+                else round(sum(result[2] for result in results) / len(timings), 2)
+            ),
+        }
+
+    @staticmethod
+    def _client_sender(path, params, token, base_url):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        def request():
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(path, params)
+            return response.status_code, len(queries)
+
+        return request
+
+    @staticmethod
+    def _http_sender(path, params, token, base_url):
+        url = base_url.rstrip("/") + path
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+
+        def request():
+            http_request = urllib.request.Request(
+                url, headers={"Authorization": f"Bearer {token}"}
+            )
+            try:
+                with urllib.request.urlopen(http_request) as response:
+                    response.read()
+                    return response.status, None
+            except urllib.error.HTTPError as exc:
+                return exc.code, None
+
+        return request
+
+    @staticmethod
+    def _commit() -> str | None:
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from ...search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the vendor/contract full-text search index from the database."
+    # Batch command: skip the URL/admin system checks (see core_project/batch_settings.py).
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        indexed = get_search_backend().rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} document(s)"))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from ...mail import DISPATCH_BALANCED, DISPATCH_SINGLE
+from ...retries import retry_failed_emails
+
+
+class Command(BaseCommand):
+    help = "Re-send failed reminder emails whose retry is due, in batches."
+    # Batch command: skip the URL/admin system checks (see core_project/batch_settings.py).
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Emails per batch.")
+        parser.add_argument(
+            "--limit", type=int, help="Stop after this many emails (defaults to all due)."
+        )
+        parser.add_argument(
+            "--dispatch",
+            choices=[DISPATCH_SINGLE, DISPATCH_BALANCED],
+            help="Credential selection (defaults to settings.REMINDER_EMAIL_DISPATCH).",
+        )
+
+    def handle(self, *args, **options):
+        result = retry_failed_emails(
+            batch_size=options["batch_size"],
+            limit=options["limit"],
+            dispatch=options["dispatch"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Retried {result.processed} email(s): {result.sent} sent, "
+                f"{result.rescheduled} rescheduled, {result.given_up} given up"
+            )
+        )
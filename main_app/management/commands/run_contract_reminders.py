@@ -1,12 +1,25 @@
 from django.core.management.base import BaseCommand
 
+from ...models import ReminderSnapshot
 from ...reminders import ReminderService
 
 
 class Command(BaseCommand):
     help = "Send reminder emails for contracts nearing expiry or payment deadlines."
+    # Batch command: skip the URL/admin system checks (see core_project/batch_settings.py).
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--no-snapshot",
+            action="store_true",
+            help="Skip storing today's report totals in the snapshot history.",
+        )
 
     def handle(self, *args, **options):
         service = ReminderService()
         payloads = service.send_notification_emails()
         self.stdout.write(self.style.SUCCESS(f"Sent {len(payloads)} reminder(s)"))
+        if not options["no_snapshot"]:
+            ReminderSnapshot.store([service.build_report(payloads)])
+            self.stdout.write(f"Stored reminder snapshot for {service.as_of}")
@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...jobs import fail_stale_jobs, resume_stale_jobs
+from ...models import ReminderJobStatus
+
+
+class Command(BaseCommand):
+    help = (
+        "Resume background reminder jobs left pending or running by a stopped worker, "
+        "continuing from their saved progress."
+    )
+    # Batch command: skip the URL/admin system checks (see core_project/batch_settings.py).
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale-minutes",
+            type=int,
+            default=30,
+            help="Treat unfinished jobs without saved progress for this long as interrupted.",
+        )
+        parser.add_argument(
+            "--fail", action="store_true", help="Mark stale jobs failed instead of resuming them."
+        )
+
+    def handle(self, *args, **options):
+        if options["stale_minutes"] < 0:
+            raise CommandError("--stale-minutes must not be negative.")
+        stale_after = timedelta(minutes=options["stale_minutes"])
+        if options["fail"]:
+            jobs = fail_stale_jobs(stale_after)
+            self.stdout.write(self.style.SUCCESS(f"Marked {len(jobs)} stale job(s) failed"))
+            return
+        jobs = resume_stale_jobs(stale_after)
+        done = sum(job.status == ReminderJobStatus.DONE for job in jobs)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Resumed {len(jobs)} stale job(s): {done} done, {len(jobs) - done} failed"
+            )
+        )
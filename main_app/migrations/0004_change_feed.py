@@ -0,0 +1,52 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0003_emaillog"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "resource",
+                    models.CharField(
+                        choices=[("vendor", "Vendor"), ("service", "Service contract")],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+            ],
+            options={
+                "ordering": ["updated_at", "object_id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="servicecontract",
+            index=models.Index(fields=["updated_at", "id"], name="service_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="vendor",
+            index=models.Index(fields=["updated_at", "id"], name="vendor_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(
+                fields=["resource", "updated_at", "object_id"],
+                name="tombstone_feed_idx",
+            ),
+        ),
+    ]
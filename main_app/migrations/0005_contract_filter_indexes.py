@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0004_change_feed"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="servicecontract",
+            index=models.Index(
+                fields=["status", "expiry_date"], name="service_status_expiry_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="servicecontract",
+            index=models.Index(
+                fields=["status", "payment_due_date"], name="service_status_payment_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="servicecontract",
+            index=models.Index(fields=["service_name"], name="service_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="servicecontract",
+            index=models.Index(fields=["amount"], name="service_amount_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="vendor",
+            index=models.Index(fields=["name"], name="vendor_name_idx"),
+        ),
+    ]
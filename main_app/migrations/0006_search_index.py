@@ -0,0 +1,54 @@
+from django.db import migrations
+
+SEARCH_TABLE = "main_app_search_fts"
+VENDOR_TSVECTOR = (
+    "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(contact_person, '')"
+    " || ' ' || coalesce(email, ''))"
+)
+SERVICE_TSVECTOR = "to_tsvector('simple', coalesce(service_name, ''))"
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            if not cursor.fetchone()[0]:
+                return
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+            "title, body, tokenize = 'unicode61', prefix = '2 3')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, title, body) "
+            "SELECT id * 2, name, contact_person || ' ' || email FROM main_app_vendor "
+            "UNION ALL SELECT id * 2 + 1, service_name, '' FROM main_app_servicecontract"
+        )
+    elif connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX main_app_vendor_search_idx ON main_app_vendor "
+            f"USING gin ({VENDOR_TSVECTOR})"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX main_app_service_search_idx ON main_app_servicecontract "
+            f"USING gin ({SERVICE_TSVECTOR})"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+    elif connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS main_app_vendor_search_idx")
+        schema_editor.execute("DROP INDEX IF EXISTS main_app_service_search_idx")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0005_contract_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0006_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReminderSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("generated_on", models.DateField()),
+                ("window_days", models.PositiveIntegerField()),
+                ("total_contracts", models.PositiveIntegerField()),
+                ("totals_by_color", models.JSONField(default=dict)),
+                ("expiry_totals_by_color", models.JSONField(default=dict)),
+                ("payment_totals_by_color", models.JSONField(default=dict)),
+            ],
+            options={
+                "ordering": ["generated_on", "window_days"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("generated_on", "window_days"),
+                        name="unique_reminder_snapshot",
+                    )
+                ],
+            },
+        ),
+    ]
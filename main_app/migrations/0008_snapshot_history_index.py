@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0007_reminder_snapshot"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="remindersnapshot",
+            index=models.Index(
+                fields=["window_days", "generated_on"], name="snapshot_history_idx"
+            ),
+        ),
+    ]
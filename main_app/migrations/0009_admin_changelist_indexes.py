@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0008_snapshot_history_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emaillog",
+            index=models.Index(fields=["created_at"], name="emaillog_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="servicecontract",
+            index=models.Index(
+                fields=["expiry_date", "payment_due_date"], name="service_expiry_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0010_reminder_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="emailcredential",
+            name="weight",
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text="Relative share of reminders sent through this credential in balanced dispatch.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="emaillog",
+            name="credential",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="SMTP credential that sent (or last attempted) the email.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="email_logs",
+                to="main_app.emailcredential",
+            ),
+        ),
+    ]
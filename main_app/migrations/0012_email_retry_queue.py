@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0011_credential_balancing"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="emaillog",
+            name="attempts",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="emaillog",
+            name="next_retry_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When a failed email is sent again; empty once sent or given up.",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="emaillog",
+            index=models.Index(
+                condition=models.Q(("next_retry_at__isnull", False)),
+                fields=["next_retry_at"],
+                name="emaillog_retry_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0012_email_retry_queue"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="servicecontract",
+            name="import_key",
+            field=models.CharField(
+                editable=False, max_length=512, null=True, unique=True
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def copy_vendor_fields(apps, schema_editor):
+    Vendor = apps.get_model("main_app", "Vendor")
+    ServiceContract = apps.get_model("main_app", "ServiceContract")
+    vendor = Vendor.objects.filter(pk=models.OuterRef("vendor_id"))
+    ServiceContract.objects.using(schema_editor.connection.alias).update(
+        vendor_name=models.Subquery(vendor.values("name")[:1]),
+        vendor_email=models.Subquery(vendor.values("email")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0013_contract_import"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="servicecontract",
+            name="vendor_email",
+            field=models.EmailField(default="", editable=False, max_length=254),
+        ),
+        migrations.AddField(
+            model_name="servicecontract",
+            name="vendor_name",
+            field=models.CharField(default="", editable=False, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="servicecontract",
+            index=models.Index(fields=["vendor_name"], name="service_vendor_name_idx"),
+        ),
+        migrations.RunPython(copy_vendor_fields, migrations.RunPython.noop),
+    ]
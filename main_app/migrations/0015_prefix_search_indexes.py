@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# ``search=`` on the contract list is an ``istartswith`` match on these columns.
+PREFIX_SEARCH_COLUMNS = {
+    "service_prefix_search_idx": "service_name",
+    "service_vendor_prefix_search_idx": "vendor_name",
+}
+
+
+def create_prefix_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for name, column in PREFIX_SEARCH_COLUMNS.items():
+        if vendor == "sqlite":
+            # ``LIKE ... ESCAPE`` can only range-scan an index with NOCASE collation.
+            expression = f"{column} COLLATE NOCASE"
+        elif vendor == "postgresql":
+            # Django compiles ``istartswith`` to ``UPPER(col::text) LIKE UPPER(%s)``.
+            expression = f"(UPPER({column}::text)) text_pattern_ops"
+        else:
+            return
+        schema_editor.execute(
+            f"CREATE INDEX {name} ON main_app_servicecontract ({expression})"
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor in ("sqlite", "postgresql"):
+        for name in PREFIX_SEARCH_COLUMNS:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main_app", "0014_denormalized_vendor"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -1,4 +1,6 @@
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class TimestampedModel(models.Model):
@@ -36,6 +38,10 @@ class Vendor(TimestampedModel):
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="vendor_updated_idx"),
+            models.Index(fields=["name"], name="vendor_name_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
         return self.name
@@ -47,6 +53,10 @@ class ServiceContract(TimestampedModel):
         on_delete=models.CASCADE,
         related_name="services",
     )
+    # Copies of the vendor's name/email so list and reminder queries skip the join;
+    # kept current by ``save()`` and :meth:`sync_vendor_fields`.
+    vendor_name = models.CharField(max_length=255, editable=False, default="")
+    vendor_email = models.EmailField(editable=False, default="")
     service_name = models.CharField(max_length=255)
     start_date = models.DateField()
     expiry_date = models.DateField()
@@ -57,12 +67,54 @@ class ServiceContract(TimestampedModel):
         choices=ServiceStatus.choices,
         default=ServiceStatus.ACTIVE,
     )
+    # Upsert key of the bulk import (``main_app/imports.py``). Contracts created
+    # through the API have none, so a vendor may hold renewals of one service.
+    import_key = models.CharField(max_length=512, null=True, unique=True, editable=False)
 
     class Meta:
         ordering = ["expiry_date", "payment_due_date"]
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="service_updated_idx"),
+            models.Index(fields=["status", "expiry_date"], name="service_status_expiry_idx"),
+            models.Index(
+                fields=["status", "payment_due_date"], name="service_status_payment_idx"
+            ),
+            models.Index(fields=["service_name"], name="service_name_idx"),
+            models.Index(fields=["amount"], name="service_amount_idx"),
+            models.Index(fields=["expiry_date", "payment_due_date"], name="service_expiry_idx"),
+            models.Index(fields=["vendor_name"], name="service_vendor_name_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
-        return f"{self.vendor.name} - {self.service_name}"
+        return f"{self.vendor_name} - {self.service_name}"
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "vendor" in update_fields:
+            if self.vendor_id is not None:
+                self.vendor_name, self.vendor_email = self.vendor.name, self.vendor.email
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "vendor_name", "vendor_email"}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def sync_vendor_fields(cls, vendor_ids) -> int:
+        """Refresh the vendor name/email copies of ``vendor_ids``' contracts in one UPDATE.
+
+        Only contracts whose copies are stale are written (and their
+        ``updated_at`` bumped, so change feeds pick up the new name).
+        """
+
+        vendor = Vendor.objects.filter(pk=models.OuterRef("vendor_id"))
+        return (
+            cls.objects.filter(vendor_id__in=vendor_ids)
+            .exclude(vendor_name=models.F("vendor__name"), vendor_email=models.F("vendor__email"))
+            .update(
+                vendor_name=models.Subquery(vendor.values("name")[:1]),
+                vendor_email=models.Subquery(vendor.values("email")[:1]),
+                updated_at=timezone.now(),
+            )
+        )
 
 
 class EmailCredential(TimestampedModel):
@@ -80,6 +132,10 @@ class EmailCredential(TimestampedModel):
         default=True,
         help_text="Only active credentials are used when dispatching reminders.",
     )
+    weight = models.PositiveIntegerField(
+        default=1,
+        help_text="Relative share of reminders sent through this credential in balanced dispatch.",
+    )
 
     class Meta:
         verbose_name = "Email credential"
@@ -93,6 +149,10 @@ class EmailCredential(TimestampedModel):
     def get_active(cls) -> "EmailCredential | None":
         return cls.objects.filter(is_active=True).order_by("-updated_at").first()
 
+    @classmethod
+    def get_all_active(cls) -> "list[EmailCredential]":
+        return list(cls.objects.filter(is_active=True).order_by("-updated_at"))
+
 
 class EmailLog(TimestampedModel):
     """Records every reminder email that the system attempts to send."""
@@ -102,15 +162,161 @@ class EmailLog(TimestampedModel):
         on_delete=models.CASCADE,
         related_name="email_logs",
     )
+    credential = models.ForeignKey(
+        EmailCredential,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="email_logs",
+        help_text="SMTP credential that sent (or last attempted) the email.",
+    )
     recipient = models.EmailField()
     sender = models.EmailField()
     subject = models.CharField(max_length=255)
     body = models.TextField()
     success = models.BooleanField(default=False)
     error_message = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=1)
+    next_retry_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When a failed email is sent again; empty once sent or given up.",
+    )
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="emaillog_created_idx"),
+            # Only failed emails awaiting a retry are indexed, keeping the queue scan small.
+            models.Index(
+                fields=["next_retry_at"],
+                name="emaillog_retry_idx",
+                condition=models.Q(next_retry_at__isnull=False),
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
         return f"Email to {self.recipient} for {self.contract.service_name}"
+
+
+class ReminderSnapshot(TimestampedModel):
+    """Pre-aggregated reminder report totals for one day and window."""
+
+    generated_on = models.DateField()
+    window_days = models.PositiveIntegerField()
+    total_contracts = models.PositiveIntegerField()
+    totals_by_color = models.JSONField(default=dict)
+    expiry_totals_by_color = models.JSONField(default=dict)
+    payment_totals_by_color = models.JSONField(default=dict)
+
+    class Meta:
+        ordering = ["generated_on", "window_days"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["generated_on", "window_days"],
+                name="unique_reminder_snapshot",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["window_days", "generated_on"], name="snapshot_history_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"Reminder snapshot {self.generated_on} ({self.window_days}d)"
+
+    @classmethod
+    def store(cls, reports) -> int:
+        """Upsert one row per report, replacing totals already stored for that day."""
+
+        snapshots = [
+            cls(
+                generated_on=report.generated_on,
+                window_days=report.window_days,
+                total_contracts=report.total_contracts,
+                totals_by_color=report.totals_by_color,
+                expiry_totals_by_color=report.expiry_totals_by_color,
+                payment_totals_by_color=report.payment_totals_by_color,
+            )
+            for report in reports
+        ]
+        cls.objects.bulk_create(
+            snapshots,
+            update_conflicts=True,
+            unique_fields=["generated_on", "window_days"],
+            update_fields=[
+                "total_contracts",
+                "totals_by_color",
+                "expiry_totals_by_color",
+                "payment_totals_by_color",
+                "updated_at",
+            ],
+        )
+        return len(snapshots)
+
+
+class Tombstone(TimestampedModel):
+    """Marks a deleted vendor/contract so change feeds can report the removal."""
+
+    RESOURCE_VENDOR = "vendor"
+    RESOURCE_SERVICE = "service"
+    RESOURCE_CHOICES = (
+        (RESOURCE_VENDOR, "Vendor"),
+        (RESOURCE_SERVICE, "Service contract"),
+    )
+
+    resource = models.CharField(max_length=20, choices=RESOURCE_CHOICES)
+    object_id = models.BigIntegerField()
+
+    class Meta:
+        ordering = ["updated_at", "object_id"]
+        indexes = [
+            models.Index(
+                fields=["resource", "updated_at", "object_id"],
+                name="tombstone_feed_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"Deleted {self.resource} #{self.object_id}"
+
+
+class ReminderJobStatus(models.TextChoices):
+    PENDING = "PENDING", "Pending"
+    RUNNING = "RUNNING", "Running"
+    DONE = "DONE", "Done"
+    FAILED = "FAILED", "Failed"
+
+
+class ReminderJob(TimestampedModel):
+    """Background reminder dispatch for a large admin selection of contracts."""
+
+    contract_ids = models.JSONField(default=list)
+    status = models.CharField(
+        max_length=20,
+        choices=ReminderJobStatus.choices,
+        default=ReminderJobStatus.PENDING,
+    )
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    sent = models.PositiveIntegerField(default=0)
+    error_message = models.TextField(blank=True)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"Reminder job #{self.pk} ({self.get_status_display()})"
+
+    @property
+    def progress(self) -> int:
+        """Percentage of selected contracts processed so far."""
+
+        return 100 if not self.total else self.processed * 100 // self.total
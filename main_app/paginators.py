@@ -0,0 +1,54 @@
+"""Paginators that avoid exact ``COUNT(*)`` scans on large tables."""
+from __future__ import annotations
+
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def estimated_row_count(model, using: str) -> int | None:
+    """Planner statistics row estimate for ``model``'s table, if the backend has one.
+
+    PostgreSQL keeps ``pg_class.reltuples`` current through autovacuum; SQLite
+    only has ``sqlite_stat1`` rows after ``ANALYZE``. ``None`` means unknown.
+    """
+
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table]
+                )
+            elif connection.vendor == "sqlite":
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:  # e.g. sqlite_stat1 does not exist before ANALYZE
+        return None
+    if row is None or row[0] is None:
+        return None
+    estimate = int(str(row[0]).split()[0])
+    return estimate if estimate >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Uses the planner's row estimate for unfiltered querysets on large tables.
+
+    Filtered querysets, and tables smaller than ``estimate_threshold`` rows, are
+    counted exactly, so page links stay correct wherever they are cheap to get.
+    """
+
+    estimate_threshold = 50_000
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
@@ -1,17 +1,24 @@
 """Reminder utilities for expiring or payment-due service contracts."""
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import date, timedelta
 
-from django.conf import settings
-from django.core.mail import EmailMessage, get_connection
-from django.db.models import Q
+from django.core.cache import cache
+from django.core.mail import EmailMessage
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Count, Q
+from django.db.models.functions import Least
+from django.utils import timezone
 
+from .mail import MailDispatcher
 from .models import EmailCredential, EmailLog, ServiceContract, ServiceStatus
+from .retries import next_retry_at
+from .routers import reporting_database
 
 
-@dataclass
+@dataclass(slots=True)
 class ReminderPayload:
     contract_id: int
     vendor: str
@@ -41,13 +48,19 @@ class ReminderPayload:
 
 @dataclass
 class ReminderReport:
+    """Report totals plus the payloads they were computed from.
+
+    ``payloads`` is either a list or, for lazy reports, a one-shot iterator that
+    streams payloads straight into the serializer without materializing them.
+    """
+
     generated_on: date
     window_days: int
     total_contracts: int
     totals_by_color: dict
     expiry_totals_by_color: dict
     payment_totals_by_color: dict
-    payloads: list[ReminderPayload]
+    payloads: Iterable[ReminderPayload]
 
     def as_dict(self) -> dict:
         return {
@@ -61,137 +74,491 @@ class ReminderReport:
         }
 
 
+COLOR_PRIORITY = {"red": 0, "yellow": 1, "green": 2}
+
+
+def color_for(days_remaining: int, window_days: int) -> str:
+    if days_remaining < 0:
+        return "red"
+    if days_remaining <= window_days:
+        return "yellow"
+    return "green"
+
+
+def dominant_color(expiry_color: str, payment_color: str) -> str:
+    return min(expiry_color, payment_color, key=lambda color: COLOR_PRIORITY[color])
+
+
+def color_conditions(as_of: date, window_days: int, field_name: str) -> dict[str, Q]:
+    """:func:`color_for` as filters on a date field (or the ``first_due`` annotation).
+
+    Applied to ``first_due`` (the earlier of both deadlines) they select the
+    dominant color, since the earliest deadline is always the most urgent one.
+    """
+
+    window_end = as_of + timedelta(days=window_days)
+    return {
+        "red": Q(**{f"{field_name}__lt": as_of}),
+        "yellow": Q(**{f"{field_name}__gte": as_of, f"{field_name}__lte": window_end}),
+        "green": Q(**{f"{field_name}__gt": window_end}),
+    }
+
+
+class _ReportAccumulator:
+    """Collects payloads and color totals for one window while contracts stream in."""
+
+    def __init__(self, window_days: int, keep_payloads: bool = True):
+        self.window_days = window_days
+        self.keep_payloads = keep_payloads
+        self.count = 0
+        self.payloads: list[ReminderPayload] = []
+        self.totals = {"red": 0, "yellow": 0, "green": 0}
+        self.expiry_totals = {"red": 0, "yellow": 0, "green": 0}
+        self.payment_totals = {"red": 0, "yellow": 0, "green": 0}
+
+    def add(self, payload: ReminderPayload) -> None:
+        if self.keep_payloads:
+            self.payloads.append(payload)
+        self.add_colors(payload.expiry_color, payload.payment_color)
+
+    def add_colors(self, expiry_color: str, payment_color: str) -> None:
+        self.count += 1
+        self.totals[dominant_color(expiry_color, payment_color)] += 1
+        self.expiry_totals[expiry_color] += 1
+        self.payment_totals[payment_color] += 1
+
+    def report(self, generated_on: date, payloads: Iterable[ReminderPayload] | None = None):
+        return ReminderReport(
+            generated_on=generated_on,
+            window_days=self.window_days,
+            total_contracts=self.count,
+            totals_by_color=self.totals,
+            expiry_totals_by_color=self.expiry_totals,
+            payment_totals_by_color=self.payment_totals,
+            payloads=self.payloads if payloads is None else payloads,
+        )
+
+
+# Aggregate names per report totals field: overall (dominant), expiry and payment.
+TOTAL_FIELDS = {"overall": "first_due", "expiry": "expiry_date", "payment": "payment_due_date"}
+TOTAL_PREFIXES = {"overall": "", "expiry": "expiry_", "payment": "payment_"}
+TOTALS_CACHE_TIMEOUT = 60 * 60
+
+
+class ReminderEngine:
+    """Builds reminder reports for several windows from a single ordered scan.
+
+    Contracts are read once, ordered by their earliest deadline. A contract that
+    falls inside a window also falls inside every larger window, so each row is
+    classified into the suffix of (sorted) windows that contain it, with colors
+    computed against each window's own threshold.
+    """
+
+    def __init__(self, windows=(7, 15, 30), as_of: date | None = None):
+        self.windows = sorted(set(windows))
+        if not self.windows or self.windows[0] < 0:
+            raise ValueError("windows must contain at least one non-negative day count")
+        self.as_of = as_of or timezone.localdate()
+
+    def _queryset(self, today: date):
+        return (
+            ServiceContract.objects.filter(
+                status__in=[ServiceStatus.ACTIVE, ServiceStatus.PAYMENT_PENDING]
+            )
+            .annotate(first_due=Least("expiry_date", "payment_due_date"))
+            .filter(first_due__lte=today + timedelta(days=self.windows[-1]))
+            .order_by("first_due", "id")
+        )
+
+    def aggregate_report(self) -> dict[int, ReminderReport]:
+        """Color totals for every window from one aggregate query; reports carry no payloads."""
+
+        today = self.as_of
+        aggregates = {}
+        for window in self.windows:
+            in_window = Q(first_due__lte=today + timedelta(days=window))
+            aggregates[f"w{window}_total"] = Count("pk", filter=in_window)
+            for kind, field_name in TOTAL_FIELDS.items():
+                for color, condition in color_conditions(today, window, field_name).items():
+                    aggregates[f"w{window}_{kind}_{color}"] = Count(
+                        "pk", filter=in_window & condition
+                    )
+        row = self._queryset(today).order_by().aggregate(**aggregates)
+        return {
+            window: ReminderReport(
+                generated_on=today,
+                window_days=window,
+                total_contracts=row[f"w{window}_total"],
+                payloads=[],
+                **{
+                    f"{prefix}totals_by_color": {
+                        color: row[f"w{window}_{kind}_{color}"] for color in COLOR_PRIORITY
+                    }
+                    for kind, prefix in TOTAL_PREFIXES.items()
+                },
+            )
+            for window in self.windows
+        }
+
+    def cached_aggregate_report(self) -> dict[int, ReminderReport]:
+        """:meth:`aggregate_report`, cached until contract or vendor data changes."""
+
+        # Imported here: the conditional-GET helpers pull in DRF, which batch commands skip.
+        from .conditional import build_validators, table_versions
+
+        version, _ = build_validators(self.as_of, self.windows, *table_versions())
+        key = f"reminder-totals:{version}"
+        reports = cache.get(key)
+        if reports is None:
+            reports = self.aggregate_report()
+            cache.set(key, reports, TOTALS_CACHE_TIMEOUT)
+        return reports
+
+    def build_report(self) -> dict[int, ReminderReport]:
+        today = self.as_of
+        accumulators = [_ReportAccumulator(window) for window in self.windows]
+        first_window = 0
+        for contract in self._queryset(today).iterator():
+            expiry_days = (contract.expiry_date - today).days
+            payment_days = (contract.payment_due_date - today).days
+            # Rows arrive in ``first_due`` order, so the smallest matching window
+            # only ever moves forward.
+            first_days = min(expiry_days, payment_days)
+            while self.windows[first_window] < first_days:
+                first_window += 1
+            for accumulator in accumulators[first_window:]:
+                accumulator.add(
+                    ReminderPayload(
+                        contract_id=contract.id,
+                        vendor=contract.vendor_name,
+                        service_name=contract.service_name,
+                        expiry_date=contract.expiry_date,
+                        payment_due_date=contract.payment_due_date,
+                        expiry_color=color_for(expiry_days, accumulator.window_days),
+                        payment_color=color_for(payment_days, accumulator.window_days),
+                        days_until_expiry=expiry_days,
+                        days_until_payment=payment_days,
+                        recipient=contract.vendor_email,
+                    )
+                )
+        return {
+            accumulator.window_days: accumulator.report(today) for accumulator in accumulators
+        }
+
+
+def _color_spans(deadline: int, window_days: int, first: int, last: int):
+    """Yield ``(color, from, to)`` day-ordinal spans of one deadline within ``[first, last]``."""
+
+    for color, low, high in (
+        ("green", first, deadline - window_days - 1),
+        ("yellow", deadline - window_days, deadline),
+        ("red", deadline + 1, last),
+    ):
+        low, high = max(low, first), min(high, last)
+        if low <= high:
+            yield color, low, high
+
+
+def build_daily_reports(start: date, end: date, window_days: int = 15) -> list[ReminderReport]:
+    """Recompute report totals for every day in ``[start, end]`` in one pass.
+
+    A contract enters the report on ``min(expiry, payment) - window_days`` and its
+    colors only change at fixed offsets from each deadline, so every contract adds
+    a few spans to per-color difference arrays; prefix sums then yield the totals
+    of each day. Contract statuses are taken as they are today. Reports carry no
+    payloads.
+    """
+
+    if end < start:
+        raise ValueError("end must not be before start")
+    first, last = start.toordinal(), end.toordinal()
+    days = last - first + 1
+    categories = ("overall", "expiry", "payment")
+    diffs = {
+        category: {color: [0] * (days + 1) for color in COLOR_PRIORITY}
+        for category in categories
+    }
+
+    contracts = (
+        ServiceContract.objects.filter(
+            status__in=[ServiceStatus.ACTIVE, ServiceStatus.PAYMENT_PENDING]
+        )
+        .annotate(first_due=Least("expiry_date", "payment_due_date"))
+        .filter(first_due__lte=end + timedelta(days=window_days))
+        .order_by("first_due", "id")
+        .values_list("expiry_date", "payment_due_date", "first_due")
+    )
+    for expiry_date, payment_due_date, first_due in contracts.iterator():
+        included_from = max(first, first_due.toordinal() - window_days)
+        if included_from > last:
+            continue
+        for category, deadline in (
+            ("overall", first_due),
+            ("expiry", expiry_date),
+            ("payment", payment_due_date),
+        ):
+            for color, low, high in _color_spans(
+                deadline.toordinal(), window_days, included_from, last
+            ):
+                diffs[category][color][low - first] += 1
+                diffs[category][color][high - first + 1] -= 1
+
+    reports: list[ReminderReport] = []
+    running = {category: dict.fromkeys(COLOR_PRIORITY, 0) for category in categories}
+    for offset in range(days):
+        for category in categories:
+            for color in COLOR_PRIORITY:
+                running[category][color] += diffs[category][color][offset]
+        reports.append(
+            ReminderReport(
+                generated_on=date.fromordinal(first + offset),
+                window_days=window_days,
+                total_contracts=sum(running["overall"].values()),
+                totals_by_color=dict(running["overall"]),
+                expiry_totals_by_color=dict(running["expiry"]),
+                payment_totals_by_color=dict(running["payment"]),
+                payloads=[],
+            )
+        )
+    return reports
+
+
 class ReminderService:
-    """Encapsulates reminder calculations and notification dispatch."""
+    """Encapsulates reminder calculations and notification dispatch.
+
+    ``as_of`` fixes the reference date for every calculation made by the
+    instance (defaults to today in ``settings.TIME_ZONE``), so a run straddling
+    midnight stays consistent and historical dates can be recomputed. Contract
+    reads use ``using``, by default :func:`~main_app.routers.reporting_database`
+    (the replica only inside ``reporting_reads()``). Email dispatch always reads
+    ``default``, so reminders never go out from replica rows that may be behind.
+    ``dispatch`` picks the email mode (``"single"`` or ``"balanced"``, see
+    ``main_app.mail``), defaulting to ``settings.REMINDER_EMAIL_DISPATCH``.
+    """
 
-    def __init__(self, window_days: int = 15, credentials: EmailCredential | None = None):
+    # Eager reports over at least this many contracts classify their date columns
+    # in one columnar pass instead of contract by contract.
+    batch_threshold = 10_000
+    # Contracts read per chunk while emailing, and per background-job batch.
+    email_batch_size = 500
+
+    def __init__(
+        self,
+        window_days: int = 15,
+        credentials: EmailCredential | None = None,
+        as_of: date | None = None,
+        using: str | None = None,
+        dispatch: str | None = None,
+    ):
         self.window_days = window_days
         self._credentials = credentials
+        self.dispatch = dispatch
+        self.as_of = as_of or timezone.localdate()
+        self.using = using or reporting_database()
 
     def _base_queryset(self):
-        today = date.today()
+        today = self.as_of
         window_end = today + timedelta(days=self.window_days)
         return (
-            ServiceContract.objects.select_related("vendor")
+            ServiceContract.objects.using(self.using)
             .filter(status__in=[ServiceStatus.ACTIVE, ServiceStatus.PAYMENT_PENDING])
             .filter(Q(expiry_date__lte=window_end) | Q(payment_due_date__lte=window_end))
         )
 
-    def build_reminder_payloads(self) -> list[ReminderPayload]:
-        today = date.today()
-        payloads: list[ReminderPayload] = []
-        for contract in self._base_queryset():
-            expiry_days = (contract.expiry_date - today).days
-            payment_days = (contract.payment_due_date - today).days
-            payloads.append(
-                ReminderPayload(
-                    contract_id=contract.id,
-                    vendor=contract.vendor.name,
-                    service_name=contract.service_name,
-                    expiry_date=contract.expiry_date,
-                    payment_due_date=contract.payment_due_date,
-                    expiry_color=self._color_for(expiry_days),
-                    payment_color=self._color_for(payment_days),
-                    days_until_expiry=expiry_days,
-                    days_until_payment=payment_days,
-                    recipient=contract.vendor.email,
-                )
+    def _payload_for(self, contract: ServiceContract) -> ReminderPayload:
+        expiry_days = (contract.expiry_date - self.as_of).days
+        payment_days = (contract.payment_due_date - self.as_of).days
+        return self._classified_payload(
+            contract,
+            expiry_days,
+            payment_days,
+            self._color_for(expiry_days),
+            self._color_for(payment_days),
+        )
+
+    @staticmethod
+    def _classified_payload(
+        contract: ServiceContract,
+        expiry_days: int,
+        payment_days: int,
+        expiry_color: str,
+        payment_color: str,
+    ) -> ReminderPayload:
+        return ReminderPayload(
+            contract_id=contract.id,
+            vendor=contract.vendor_name,
+            service_name=contract.service_name,
+            expiry_date=contract.expiry_date,
+            payment_due_date=contract.payment_due_date,
+            expiry_color=expiry_color,
+            payment_color=payment_color,
+            days_until_expiry=expiry_days,
+            days_until_payment=payment_days,
+            recipient=contract.vendor_email,
+        )
+
+    def payloads_for(self, contracts: Iterable[ServiceContract]) -> list[ReminderPayload]:
+        return [self._payload_for(contract) for contract in contracts]
+
+    def color_queryset(self, color: str | None = None):
+        """Window contracts, earliest deadline first, optionally of one overall color."""
+
+        queryset = self._base_queryset().annotate(
+            first_due=Least("expiry_date", "payment_due_date")
+        )
+        if color:
+            queryset = queryset.filter(
+                color_conditions(self.as_of, self.window_days, "first_due")[color]
             )
-        return payloads
+        return queryset.order_by("first_due", "id")
+
+    def iter_reminder_payloads(self) -> Iterator[ReminderPayload]:
+        """Stream payloads from a server-side cursor without holding them all."""
+
+        for contract in self._base_queryset().iterator(chunk_size=2000):
+            yield self._payload_for(contract)
+
+    async def aiter_reminder_payloads(self) -> AsyncIterator[ReminderPayload]:
+        """Async counterpart of :meth:`iter_reminder_payloads` for ASGI views."""
+
+        async for contract in self._base_queryset().aiterator(chunk_size=2000):
+            yield self._payload_for(contract)
+
+    def build_reminder_payloads(self) -> list[ReminderPayload]:
+        return list(self.iter_reminder_payloads())
 
-    def build_report(self) -> ReminderReport:
-        payloads = self.build_reminder_payloads()
-        color_totals = {"red": 0, "yellow": 0, "green": 0}
-        expiry_totals = {"red": 0, "yellow": 0, "green": 0}
-        payment_totals = {"red": 0, "yellow": 0, "green": 0}
+    def build_report(
+        self, payloads: list[ReminderPayload] | None = None, lazy: bool = False
+    ) -> ReminderReport:
+        """Aggregate ``payloads`` (built on demand when omitted) into a report.
+
+        With ``lazy=True`` the totals come from a date-only pass and ``payloads``
+        is an iterator that re-reads the contracts when consumed, so at most one
+        chunk of payload objects is alive at a time. Rows written between the two
+        passes may make the totals and payloads disagree slightly.
+        """
+
+        if payloads is None and lazy:
+            return self._build_lazy_report()
+        if payloads is None:
+            contracts = list(self._base_queryset())
+            if len(contracts) >= self.batch_threshold:
+                return self._build_batch_report(contracts)
+            payloads = self.payloads_for(contracts)
+        accumulator = _ReportAccumulator(self.window_days)
         for payload in payloads:
-            dominant_color = self._dominant_color(payload)
-            color_totals[dominant_color] += 1
-            expiry_totals[payload.expiry_color] += 1
-            payment_totals[payload.payment_color] += 1
+            accumulator.add(payload)
+        return accumulator.report(self.as_of)
+
+    def _build_lazy_report(self) -> ReminderReport:
+        accumulator = _ReportAccumulator(self.window_days, keep_payloads=False)
+        for expiry_date, payment_due_date in self._date_rows().iterator(chunk_size=2000):
+            self._count_dates(accumulator, expiry_date, payment_due_date)
+        return accumulator.report(self.as_of, payloads=self.iter_reminder_payloads())
+
+    async def abuild_report(self) -> ReminderReport:
+        """Async lazy report: totals are computed here, payloads stream on demand.
+
+        The returned ``payloads`` is an async iterator, so consumers must use
+        ``async for`` instead of handing the report to a sync serializer.
+        """
+
+        accumulator = _ReportAccumulator(self.window_days, keep_payloads=False)
+        # values() rather than values_list(): Django's values_list iterable runs
+        # its query on creation, which aiterator() does outside the thread pool.
+        rows = self._base_queryset().values("expiry_date", "payment_due_date")
+        async for row in rows.aiterator(chunk_size=2000):
+            self._count_dates(accumulator, row["expiry_date"], row["payment_due_date"])
+        return accumulator.report(self.as_of, payloads=self.aiter_reminder_payloads())
+
+    def _date_rows(self):
+        return self._base_queryset().values_list("expiry_date", "payment_due_date")
+
+    def _count_dates(self, accumulator, expiry_date: date, payment_due_date: date) -> None:
+        accumulator.add_colors(
+            self._color_for((expiry_date - self.as_of).days),
+            self._color_for((payment_due_date - self.as_of).days),
+        )
+
+    def _build_batch_report(self, contracts: list[ServiceContract]) -> ReminderReport:
+        # Imported on first use: loading NumPy dominates startup of small runs.
+        from .classification import classify_batch, color_names, color_totals
+
+        batch = classify_batch(
+            [contract.expiry_date for contract in contracts],
+            [contract.payment_due_date for contract in contracts],
+            self.as_of,
+            self.window_days,
+        )
+        payloads = list(
+            map(
+                self._classified_payload,
+                contracts,
+                batch.days_until_expiry.tolist(),
+                batch.days_until_payment.tolist(),
+                color_names(batch.expiry_codes),
+                color_names(batch.payment_codes),
+            )
+        )
         return ReminderReport(
-            generated_on=date.today(),
+            generated_on=self.as_of,
             window_days=self.window_days,
             total_contracts=len(payloads),
-            totals_by_color=color_totals,
-            expiry_totals_by_color=expiry_totals,
-            payment_totals_by_color=payment_totals,
+            totals_by_color=color_totals(batch.dominant_codes),
+            expiry_totals_by_color=color_totals(batch.expiry_codes),
+            payment_totals_by_color=color_totals(batch.payment_codes),
             payloads=payloads,
         )
 
-    def send_notification_emails(self) -> list[ReminderPayload]:
-        payloads = self.build_reminder_payloads()
-        connection = self._connection()
-        sender = self._sender_email()
-        for reminder in payloads:
-            subject = f"Contract reminder: {reminder.service_name}"
-            body = (
-                f"Vendor: {reminder.vendor}\n"
-                f"Service: {reminder.service_name}\n"
-                f"Expiry date: {reminder.expiry_date} (status: {reminder.expiry_color})\n"
-                f"Payment due: {reminder.payment_due_date} (status: {reminder.payment_color})\n"
-            )
-            success = True
-            error_message = ""
-            try:
-                EmailMessage(
-                    subject,
-                    body,
-                    sender,
-                    [reminder.recipient],
-                    connection=connection,
-                ).send(fail_silently=False)
-            except Exception as exc:  # pragma: no cover - network failures are rare
-                success = False
-                error_message = str(exc)
-            EmailLog.objects.create(
-                contract_id=reminder.contract_id,
-                recipient=reminder.recipient,
-                sender=sender,
-                subject=subject,
-                body=body,
-                success=success,
-                error_message=error_message,
-            )
-        return payloads
+    def send_notification_emails(self, contracts=None) -> list[ReminderPayload]:
+        """Email every reminder payload and log each attempt.
 
-    def _color_for(self, days_remaining: int) -> str:
-        if days_remaining < 0:
-            return "red"
-        if days_remaining <= self.window_days:
-            return "yellow"
-        return "green"
+        ``contracts`` (a queryset on ``default``) limits dispatch to those of its
+        contracts that are inside the window. Messages reuse warm SMTP sessions.
+        Each log is written as soon as its message is sent, so a run that dies
+        midway keeps the logs (and retry entries) of the emails it already sent.
+        """
 
-    def _dominant_color(self, payload: ReminderPayload) -> str:
-        priority = {"red": 0, "yellow": 1, "green": 2}
-        return min(
-            payload.expiry_color,
-            payload.payment_color,
-            key=lambda color: priority[color],
-        )
+        queryset = self._base_queryset().using(DEFAULT_DB_ALIAS)
+        if contracts is not None:
+            queryset = queryset.filter(pk__in=contracts.values("pk"))
+        payloads: list[ReminderPayload] = []
+        with self._dispatcher() as dispatcher:
+            for contract in queryset.iterator(chunk_size=self.email_batch_size):
+                reminder = self._payload_for(contract)
+                payloads.append(reminder)
+                self._send_reminder(reminder, dispatcher).save(force_insert=True)
+        return payloads
 
-    def _connection(self):
-        credentials = self._get_credentials()
-        if not credentials:
-            return get_connection()
-        backend = "django.core.mail.backends.smtp.EmailBackend"
-        return get_connection(
-            backend=backend,
-            host=credentials.smtp_host,
-            port=credentials.smtp_port,
-            username=credentials.username or None,
-            password=credentials.password or None,
-            use_tls=credentials.use_tls,
-            use_ssl=credentials.use_ssl,
+    def _send_reminder(self, reminder: ReminderPayload, dispatcher: MailDispatcher) -> EmailLog:
+        subject = f"Contract reminder: {reminder.service_name}"
+        body = (
+            f"Vendor: {reminder.vendor}\n"
+            f"Service: {reminder.service_name}\n"
+            f"Expiry date: {reminder.expiry_date} (status: {reminder.expiry_color})\n"
+            f"Payment due: {reminder.payment_due_date} (status: {reminder.payment_color})\n"
+        )
+        message = EmailMessage(subject, body, to=[reminder.recipient])
+        credential, sent, error_message = dispatcher.send(message)
+        return EmailLog(
+            contract_id=reminder.contract_id,
+            credential=credential,
+            recipient=reminder.recipient,
+            sender=message.from_email,
+            subject=subject,
+            body=body,
+            success=sent,
+            error_message=error_message,
+            next_retry_at=None if sent else next_retry_at(1),
         )
 
-    def _sender_email(self) -> str:
-        credentials = self._get_credentials()
-        if credentials:
-            return credentials.from_email
-        return settings.DEFAULT_FROM_EMAIL
+    def _color_for(self, days_remaining: int) -> str:
+        return color_for(days_remaining, self.window_days)
+
+    def _dominant_color(self, payload: ReminderPayload) -> str:
+        return dominant_color(payload.expiry_color, payload.payment_color)
 
-    def _get_credentials(self) -> EmailCredential | None:
-        if self._credentials is None:
-            self._credentials = EmailCredential.get_active()
-        return self._credentials
+    def _dispatcher(self) -> MailDispatcher:
+        if self._credentials is not None:
+            return MailDispatcher([self._credentials])
+        return MailDispatcher.for_mode(self.dispatch)
@@ -0,0 +1,101 @@
+"""Retry queue for reminder emails that failed to send.
+
+A failed send leaves its ``EmailLog`` row with ``next_retry_at`` set; the
+``retry_failed_reminders`` command re-sends due rows in batches, updating the
+same row. Each further failure doubles the delay
+(``REMINDER_RETRY_BASE_SECONDS * 2**(attempts - 1)``) until
+``REMINDER_RETRY_MAX_ATTEMPTS`` is reached, after which the row stays failed
+with ``next_retry_at`` cleared.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.utils import timezone
+
+from .mail import MailDispatcher
+from .models import EmailLog
+
+DEFAULT_RETRY_BASE_SECONDS = 300
+DEFAULT_RETRY_MAX_ATTEMPTS = 5
+RETRY_UPDATE_FIELDS = [
+    "credential",
+    "sender",
+    "success",
+    "error_message",
+    "attempts",
+    "next_retry_at",
+    "updated_at",
+]
+
+
+def next_retry_at(attempts: int, now: datetime | None = None) -> datetime | None:
+    """When to retry an email that has failed ``attempts`` times, or ``None`` to give up."""
+
+    if attempts >= getattr(settings, "REMINDER_RETRY_MAX_ATTEMPTS", DEFAULT_RETRY_MAX_ATTEMPTS):
+        return None
+    base = getattr(settings, "REMINDER_RETRY_BASE_SECONDS", DEFAULT_RETRY_BASE_SECONDS)
+    return (now or timezone.now()) + timedelta(seconds=base * 2 ** (attempts - 1))
+
+
+def due_retries(now: datetime | None = None):
+    return EmailLog.objects.filter(next_retry_at__lte=now or timezone.now()).order_by(
+        "next_retry_at", "pk"
+    )
+
+
+@dataclass
+class RetryResult:
+    processed: int = 0
+    sent: int = 0
+    rescheduled: int = 0
+    given_up: int = 0
+
+
+def retry_failed_emails(
+    batch_size: int = 100,
+    limit: int | None = None,
+    now: datetime | None = None,
+    dispatch: str | None = None,
+) -> RetryResult:
+    """Re-send failed emails whose retry is due, ``batch_size`` rows at a time.
+
+    Rows are re-read per batch; every processed row is either sent, moved into
+    the future or taken off the queue, so the loop ends once nothing is due as
+    of ``now``. Run one retry process at a time (e.g. from a single scheduler).
+    """
+
+    now = now or timezone.now()
+    result = RetryResult()
+    with MailDispatcher.for_mode(dispatch) as dispatcher:
+        while limit is None or result.processed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - result.processed)
+            batch = list(due_retries(now)[:size])
+            if not batch:
+                break
+            for log in batch:
+                _retry(log, dispatcher, now, result)
+            EmailLog.objects.bulk_update(batch, RETRY_UPDATE_FIELDS)
+    return result
+
+
+def _retry(log: EmailLog, dispatcher: MailDispatcher, now: datetime, result: RetryResult):
+    message = EmailMessage(log.subject, log.body, to=[log.recipient])
+    credential, sent, error_message = dispatcher.send(message)
+    log.attempts += 1
+    log.credential = credential
+    log.sender = message.from_email
+    log.success = sent
+    log.error_message = error_message
+    log.next_retry_at = None if log.success else next_retry_at(log.attempts, now)
+    log.updated_at = now
+    result.processed += 1
+    if log.success:
+        result.sent += 1
+    elif log.next_retry_at is None:
+        result.given_up += 1
+    else:
+        result.rescheduled += 1
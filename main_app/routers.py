@@ -0,0 +1,120 @@
+"""Read-replica routing for reporting queries.
+
+Reporting reads (reminder payloads and reports, the email-log feed and report
+history) go to ``settings.REPORTING_DATABASE`` when that alias is configured;
+everything else, and every write, stays on ``default``. A user who just changed
+a contract is pinned to ``default`` for ``REPLICA_PIN_SECONDS`` so they read
+their own writes while the replica catches up. The pin is a signed, timestamped
+cookie, so it reaches whichever worker process serves the next request.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+_reporting = ContextVar("reporting_reads", default=False)
+_pinned = ContextVar("pinned_to_primary", default=False)
+
+DEFAULT_PIN_SECONDS = 10
+PIN_COOKIE = "replica_pin"
+PIN_SALT = "main_app.routers.pin_to_primary"
+
+
+def reporting_database() -> str:
+    """Alias for reads made now: the replica inside :func:`reporting_reads`, else ``default``.
+
+    Inside the block, ``default`` is still returned when no replica is configured
+    or the user is pinned to primary.
+    """
+
+    alias = getattr(settings, "REPORTING_DATABASE", None)
+    if not _reporting.get() or not alias or alias not in settings.DATABASES or _pinned.get():
+        return DEFAULT_DB_ALIAS
+    return alias
+
+
+def _pin_seconds() -> int:
+    return getattr(settings, "REPLICA_PIN_SECONDS", DEFAULT_PIN_SECONDS)
+
+
+def pin_to_primary(response, user) -> None:
+    """Route ``user``'s reporting reads to ``default`` for the next few seconds.
+
+    Sets a cookie on ``response`` holding the user id, signed with a timestamp.
+    """
+
+    if user is not None and user.is_authenticated:
+        response.set_signed_cookie(
+            PIN_COOKIE,
+            str(user.pk),
+            salt=PIN_SALT,
+            max_age=_pin_seconds(),
+            httponly=True,
+            samesite="Lax",
+        )
+
+
+def is_pinned(request) -> bool:
+    """Whether ``request`` carries an unexpired pin cookie for its own user."""
+
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return False
+    pinned_pk = request.get_signed_cookie(
+        PIN_COOKIE, default=None, salt=PIN_SALT, max_age=_pin_seconds()
+    )
+    return pinned_pk == str(user.pk)
+
+
+@contextmanager
+def reporting_reads(request=None):
+    """Send reads made inside the block to :func:`reporting_database`."""
+
+    pinned = _pinned.set(_pinned.get() or (request is not None and is_pinned(request)))
+    reporting = _reporting.set(True)
+    try:
+        yield
+    finally:
+        _reporting.reset(reporting)
+        _pinned.reset(pinned)
+
+
+class ReportingReplicaRouter:
+    """Database router enabled through ``DATABASE_ROUTERS``."""
+
+    def db_for_read(self, model, **hints):
+        return reporting_database() if _reporting.get() else None
+
+    def db_for_write(self, model, **hints):
+        # Rows read from the replica carry its alias; writes must never follow it.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows as default.
+        return True
+
+
+class ReportingReadsMixin:
+    """Runs a DRF view's handler inside :func:`reporting_reads` for the request.
+
+    The block is entered once the user is authenticated and left in ``dispatch``,
+    so a handler that raises does not leave the worker thread routed to the replica.
+    """
+
+    _reporting_reads = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._reporting_reads = reporting_reads(request)
+        self._reporting_reads.__enter__()
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            context, self._reporting_reads = self._reporting_reads, None
+            if context is not None:
+                context.__exit__(None, None, None)
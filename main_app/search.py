@@ -0,0 +1,261 @@
+"""Full-text search over vendors and service contracts.
+
+SQLite databases keep an FTS5 table (``main_app_search_fts``) that signal
+handlers update on every save/delete. PostgreSQL queries ``tsvector`` expressions
+directly, served by the GIN indexes created in the search migration. Any other
+backend falls back to ``icontains`` lookups so the API keeps working.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import ServiceContract, Vendor
+
+SEARCH_TABLE = "main_app_search_fts"
+KIND_VENDOR = "vendor"
+KIND_SERVICE = "service"
+# FTS5 rowids pack the kind into the low bit: ``object_id * 2 + code``.
+KIND_CODES = {KIND_VENDOR: 0, KIND_SERVICE: 1}
+
+VENDOR_TSVECTOR = (
+    "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(contact_person, '')"
+    " || ' ' || coalesce(email, ''))"
+)
+SERVICE_TSVECTOR = "to_tsvector('simple', coalesce(service_name, ''))"
+# FTS5 ``(title, body)`` SQL per kind, matching vendor_document/service_document.
+DOCUMENT_COLUMNS = {
+    KIND_VENDOR: ("name", "contact_person || ' ' || email"),
+    KIND_SERVICE: ("service_name", "''"),
+}
+# Ids per statement when re-indexing, below SQLite's bound-parameter limit.
+INDEX_BATCH_SIZE = 500
+
+
+@dataclass
+class SearchHit:
+    kind: str
+    object_id: int
+    rank: float
+
+
+def search_terms(text: str) -> list[str]:
+    """Split user input into word tokens (punctuation such as ``@`` separates)."""
+
+    return re.findall(r"\w+", text.lower())
+
+
+def vendor_document(vendor: Vendor) -> tuple[str, str]:
+    return vendor.name, f"{vendor.contact_person} {vendor.email}"
+
+
+def service_document(contract: ServiceContract) -> tuple[str, str]:
+    return contract.service_name, ""
+
+
+class BaseSearchBackend:
+    """``icontains`` fallback used when no full-text engine is available."""
+
+    fields = {
+        KIND_VENDOR: ("name", "contact_person", "email"),
+        KIND_SERVICE: ("service_name",),
+    }
+    models = {KIND_VENDOR: Vendor, KIND_SERVICE: ServiceContract}
+
+    def __init__(self, using: str = DEFAULT_DB_ALIAS):
+        self.using = using
+
+    def matching_ids(self, text: str, kind: str):
+        """Return something usable as ``pk__in=`` for every ``kind`` row matching ``text``."""
+
+        condition = Q()
+        for term in search_terms(text):
+            term_condition = Q()
+            for field_name in self.fields[kind]:
+                term_condition |= Q(**{f"{field_name}__icontains": term})
+            condition &= term_condition
+        return self.models[kind].objects.using(self.using).filter(condition).values("pk")
+
+    def search(self, text: str, kinds=None, limit: int = 20) -> list[SearchHit]:
+        hits: list[SearchHit] = []
+        if not search_terms(text):
+            return hits
+        for kind in kinds or KIND_CODES:
+            ids = self.matching_ids(text, kind).order_by("pk")[:limit]
+            hits.extend(SearchHit(kind, row["pk"], 0.0) for row in ids)
+        return hits[:limit]
+
+    def index(self, kind: str, obj) -> None:
+        """Fallback and PostgreSQL search read the base tables; nothing to store."""
+
+    def remove(self, kind: str, object_id: int) -> None:
+        pass
+
+    def index_ids(self, kind: str, ids) -> None:
+        """Re-index the ``kind`` rows with primary keys ``ids`` (after bulk writes)."""
+
+    def rebuild(self) -> int:
+        return 0
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """FTS5 index with BM25 ranking (service/vendor names weighted over details)."""
+
+    @staticmethod
+    def match_expression(text: str) -> str:
+        # Each token is quoted (so FTS5 operators in user input are inert) and
+        # prefix-matched; tokens are implicitly AND-ed.
+        return " ".join(f'"{term}"*' for term in search_terms(text))
+
+    def matching_ids(self, text: str, kind: str):
+        return RawSQL(
+            f"SELECT rowid >> 1 FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s AND (rowid & 1) = %s",
+            (self.match_expression(text), KIND_CODES[kind]),
+        )
+
+    def search(self, text: str, kinds=None, limit: int = 20) -> list[SearchHit]:
+        if not search_terms(text):
+            return []
+        codes = [KIND_CODES[kind] for kind in kinds or KIND_CODES]
+        placeholders = ", ".join("%s" for _ in codes)
+        kind_names = {code: kind for kind, code in KIND_CODES.items()}
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid, bm25({SEARCH_TABLE}, 10.0, 1.0) AS score "
+                f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s "
+                f"AND (rowid & 1) IN ({placeholders}) ORDER BY score LIMIT %s",
+                [self.match_expression(text), *codes, limit],
+            )
+            return [
+                SearchHit(kind_names[rowid & 1], rowid >> 1, -score)
+                for rowid, score in cursor.fetchall()
+            ]
+
+    def index(self, kind: str, obj) -> None:
+        title, body = vendor_document(obj) if kind == KIND_VENDOR else service_document(obj)
+        rowid = obj.pk * 2 + KIND_CODES[kind]
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [rowid])
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, title, body) VALUES (%s, %s, %s)",
+                [rowid, title, body],
+            )
+
+    def remove(self, kind: str, object_id: int) -> None:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s",
+                [object_id * 2 + KIND_CODES[kind]],
+            )
+
+    def index_ids(self, kind: str, ids) -> None:
+        """Replace the documents of ``ids`` with set-based deletes and inserts."""
+
+        ids = list(ids)
+        code = KIND_CODES[kind]
+        title, body = DOCUMENT_COLUMNS[kind]
+        table = self.models[kind]._meta.db_table
+        with connections[self.using].cursor() as cursor:
+            for start in range(0, len(ids), INDEX_BATCH_SIZE):
+                batch = ids[start : start + INDEX_BATCH_SIZE]
+                placeholders = ", ".join("%s" for _ in batch)
+                cursor.execute(
+                    f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})",
+                    [pk * 2 + code for pk in batch],
+                )
+                cursor.execute(
+                    f"INSERT INTO {SEARCH_TABLE} (rowid, title, body) "
+                    f"SELECT id * 2 + %s, {title}, {body} FROM {table} "
+                    f"WHERE id IN ({placeholders})",
+                    [code, *batch],
+                )
+
+    def rebuild(self) -> int:
+        """Re-populate the FTS table from the base tables with two set-based inserts."""
+
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+            cursor.execute(populate_sql(Vendor, ServiceContract))
+            cursor.execute(f"SELECT count(*) FROM {SEARCH_TABLE}")
+            return cursor.fetchone()[0]
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """``tsvector`` search ranked with ``ts_rank`` over the GIN-indexed expressions."""
+
+    queries = {
+        KIND_VENDOR: (Vendor, VENDOR_TSVECTOR),
+        KIND_SERVICE: (ServiceContract, SERVICE_TSVECTOR),
+    }
+
+    @staticmethod
+    def tsquery(text: str) -> str:
+        return " & ".join(f"{term}:*" for term in search_terms(text))
+
+    def matching_ids(self, text: str, kind: str):
+        model, vector = self.queries[kind]
+        return RawSQL(
+            f"SELECT id FROM {model._meta.db_table} "
+            f"WHERE {vector} @@ to_tsquery('simple', %s)",
+            (self.tsquery(text),),
+        )
+
+    def search(self, text: str, kinds=None, limit: int = 20) -> list[SearchHit]:
+        if not search_terms(text):
+            return []
+        selects = []
+        params: list = []
+        for kind in kinds or KIND_CODES:
+            model, vector = self.queries[kind]
+            selects.append(
+                f"SELECT %s::text AS kind, id, ts_rank({vector}, query) AS score "
+                f"FROM {model._meta.db_table}, to_tsquery('simple', %s) query "
+                f"WHERE {vector} @@ query"
+            )
+            params.extend([kind, self.tsquery(text)])
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                " UNION ALL ".join(selects) + " ORDER BY score DESC LIMIT %s",
+                [*params, limit],
+            )
+            return [SearchHit(kind, object_id, score) for kind, object_id, score in cursor]
+
+
+def populate_sql(vendor_model, service_model) -> str:
+    """``INSERT ... SELECT`` that fills the FTS table from the base tables."""
+
+    vendor_title, vendor_body = DOCUMENT_COLUMNS[KIND_VENDOR]
+    service_title, service_body = DOCUMENT_COLUMNS[KIND_SERVICE]
+    return (
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, body) "
+        f"SELECT id * 2, {vendor_title}, {vendor_body} "
+        f"FROM {vendor_model._meta.db_table} "
+        f"UNION ALL SELECT id * 2 + 1, {service_title}, {service_body} "
+        f"FROM {service_model._meta.db_table}"
+    )
+
+
+_backend_classes: dict[tuple[str, str], type[BaseSearchBackend]] = {}
+
+
+def get_search_backend(using: str = DEFAULT_DB_ALIAS) -> BaseSearchBackend:
+    """Pick the backend for ``using``; the FTS table check runs once per database."""
+
+    connection = connections[using]
+    key = (using, str(connection.settings_dict["NAME"]))
+    if key not in _backend_classes:
+        backend_class = BaseSearchBackend
+        if connection.vendor == "postgresql":
+            backend_class = PostgresSearchBackend
+        elif (
+            connection.vendor == "sqlite"
+            and SEARCH_TABLE in connection.introspection.table_names()
+        ):
+            backend_class = SQLiteSearchBackend
+        _backend_classes[key] = backend_class
+    return _backend_classes[key](using)
@@ -1,11 +1,66 @@
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 
-from .models import EmailLog, ServiceContract, ServiceStatus, Vendor
-from .reminders import ReminderReport
+from .models import EmailLog, ReminderSnapshot, ServiceContract, ServiceStatus, Vendor
 
 
-class ServiceContractSerializer(serializers.ModelSerializer):
-    vendor_name = serializers.CharField(source="vendor.name", read_only=True)
+def query_param_list(request, name: str) -> list[str] | None:
+    """Split a comma separated query parameter; ``None`` when it is absent.
+
+    Only read requests are considered so ``?fields=`` can never hide fields that
+    a create/update payload needs to validate.
+    """
+
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    raw = request.query_params.get(name)
+    if raw is None:
+        return None
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+class SparseFieldsetMixin:
+    """Restricts output to ``?fields=`` and adds relations named in ``?expand=``.
+
+    Without ``?fields=`` the serializer renders its full default field set.
+    ``expandable_fields`` maps a field name to a serializer class that replaces
+    the default representation (e.g. a primary key) when expanded.
+    """
+
+    expandable_fields: dict = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        fields = query_param_list(request, "fields")
+        expand = set(query_param_list(request, "expand") or ())
+        for name in expand & self.expandable_fields.keys():
+            self.fields[name] = self.expandable_fields[name](read_only=True)
+        if fields is not None:
+            keep = set(fields) | expand
+            for name in list(self.fields):
+                if name not in keep:
+                    self.fields.pop(name)
+
+    @classmethod
+    def requested_fields(cls, request) -> tuple[set[str], set[str]]:
+        """Return ``(fields, expanded)`` that a read request will render."""
+
+        declared = set(cls.Meta.fields)
+        fields = query_param_list(request, "fields")
+        expand = set(query_param_list(request, "expand") or ()) & declared
+        selected = declared if fields is None else set(fields) & declared
+        return selected | expand, expand
+
+
+class VendorSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Vendor
+        fields = ["id", "name", "contact_person", "email", "phone", "status"]
+
+
+class ServiceContractSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    expandable_fields = {"vendor": VendorSummarySerializer}
 
     class Meta:
         model = ServiceContract
@@ -22,7 +77,7 @@ class ServiceContractSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["created_at", "updated_at"]
+        read_only_fields = ["vendor_name", "created_at", "updated_at"]
 
 
 class ActiveServiceSerializer(serializers.ModelSerializer):
@@ -38,7 +93,7 @@ class ActiveServiceSerializer(serializers.ModelSerializer):
         ]
 
 
-class VendorSerializer(serializers.ModelSerializer):
+class VendorSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     active_services = serializers.SerializerMethodField()
 
     class Meta:
@@ -57,7 +112,9 @@ class VendorSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at", "active_services"]
 
     def get_active_services(self, vendor: Vendor):
-        services = vendor.services.filter(status=ServiceStatus.ACTIVE)
+        services = getattr(vendor, "active_service_list", None)
+        if services is None:
+            services = vendor.services.filter(status=ServiceStatus.ACTIVE)
         return ActiveServiceSerializer(services, many=True).data
 
 
@@ -79,6 +136,12 @@ class ReminderSerializer(serializers.Serializer):
 
 
 class ReminderReportSerializer(serializers.Serializer):
+    """Serializes a ``ReminderReport`` (or its ``as_dict()``) by attribute access.
+
+    Lazy payload iterators are consumed exactly once, straight from the payload
+    objects, without an intermediate dict per payload.
+    """
+
     generated_on = serializers.DateField()
     window_days = serializers.IntegerField()
     total_contracts = serializers.IntegerField()
@@ -87,14 +150,23 @@ class ReminderReportSerializer(serializers.Serializer):
     payment_totals_by_color = serializers.DictField(child=serializers.IntegerField())
     payloads = ReminderSerializer(many=True)
 
-    def to_representation(self, instance: ReminderReport | dict):
-        if isinstance(instance, ReminderReport):
-            instance = instance.as_dict()
-        return super().to_representation(instance)
+
+class ReminderSnapshotSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ReminderSnapshot
+        fields = [
+            "generated_on",
+            "window_days",
+            "total_contracts",
+            "totals_by_color",
+            "expiry_totals_by_color",
+            "payment_totals_by_color",
+        ]
+        read_only_fields = fields
 
 
 class EmailLogSerializer(serializers.ModelSerializer):
-    vendor = serializers.CharField(source="contract.vendor.name", read_only=True)
+    vendor = serializers.CharField(source="contract.vendor_name", read_only=True)
     service_name = serializers.CharField(source="contract.service_name", read_only=True)
 
     class Meta:
@@ -106,10 +178,21 @@ class EmailLogSerializer(serializers.ModelSerializer):
             "service_name",
             "recipient",
             "sender",
+            "credential",
             "subject",
             "body",
             "success",
             "error_message",
+            "attempts",
+            "next_retry_at",
             "created_at",
         ]
         read_only_fields = fields
+
+
+class SearchResultSerializer(serializers.Serializer):
+    type = serializers.CharField()
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    subtitle = serializers.CharField()
+    rank = serializers.FloatField()
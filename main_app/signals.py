@@ -0,0 +1,86 @@
+"""Model signal handlers for the vendor/contract app."""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .mail import invalidate_credentials
+from .models import EmailCredential, ServiceContract, Tombstone, Vendor
+from .search import KIND_SERVICE, KIND_VENDOR, get_search_backend
+from .windows import WINDOW_FIELDS, DayBucketIndex, invalidate_all
+
+
+@receiver(post_delete, sender=Vendor, dispatch_uid="vendor_tombstone")
+def record_vendor_tombstone(sender, instance, **kwargs):
+    Tombstone.objects.create(resource=Tombstone.RESOURCE_VENDOR, object_id=instance.pk)
+
+
+@receiver(post_delete, sender=ServiceContract, dispatch_uid="service_tombstone")
+def record_service_tombstone(sender, instance, **kwargs):
+    Tombstone.objects.create(resource=Tombstone.RESOURCE_SERVICE, object_id=instance.pk)
+
+
+@receiver(post_save, sender=Vendor, dispatch_uid="vendor_search_index")
+def index_vendor(sender, instance, raw=False, using=None, **kwargs):
+    if not raw:
+        get_search_backend(using).index(KIND_VENDOR, instance)
+
+
+@receiver(post_save, sender=Vendor, dispatch_uid="vendor_contract_sync")
+def sync_vendor_contracts(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw or created or (update_fields is not None and not {"name", "email"} & update_fields):
+        return
+    ServiceContract.sync_vendor_fields([instance.pk])
+
+
+@receiver(post_save, sender=ServiceContract, dispatch_uid="service_search_index")
+def index_service(sender, instance, raw=False, using=None, **kwargs):
+    if not raw:
+        get_search_backend(using).index(KIND_SERVICE, instance)
+
+
+@receiver(pre_save, sender=ServiceContract, dispatch_uid="service_window_previous")
+def remember_window_dates(sender, instance, raw=False, using=None, update_fields=None, **kwargs):
+    """Keep the stored dates so moving a contract also clears its old window blocks."""
+
+    instance._window_previous = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not set(WINDOW_FIELDS) & set(update_fields):
+        return
+    instance._window_previous = (
+        sender._base_manager.using(using).filter(pk=instance.pk).values(*WINDOW_FIELDS).first()
+    )
+
+
+@receiver(post_save, sender=ServiceContract, dispatch_uid="service_window_invalidate")
+@receiver(post_delete, sender=ServiceContract, dispatch_uid="service_window_unindex")
+def invalidate_window_blocks(sender, instance, raw=False, using=None, **kwargs):
+    if raw:
+        invalidate_all()
+        return
+    previous = getattr(instance, "_window_previous", None) or {}
+    days = {field: (getattr(instance, field), previous.get(field)) for field in WINDOW_FIELDS}
+
+    def invalidate():
+        for field, values in days.items():
+            DayBucketIndex(field).invalidate(values)
+
+    # Again after commit, so a feed read during the transaction is not kept.
+    invalidate()
+    transaction.on_commit(invalidate, using=using)
+
+
+@receiver(post_delete, sender=Vendor, dispatch_uid="vendor_search_unindex")
+def unindex_vendor(sender, instance, using=None, **kwargs):
+    get_search_backend(using).remove(KIND_VENDOR, instance.pk)
+
+
+@receiver(post_delete, sender=ServiceContract, dispatch_uid="service_search_unindex")
+def unindex_service(sender, instance, using=None, **kwargs):
+    get_search_backend(using).remove(KIND_SERVICE, instance.pk)
+
+
+@receiver(post_save, sender=EmailCredential, dispatch_uid="credential_cache_save")
+@receiver(post_delete, sender=EmailCredential, dispatch_uid="credential_cache_delete")
+def invalidate_credential_cache(sender, **kwargs):
+    invalidate_credentials()
@@ -1,14 +1,18 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from . import async_views
 from .views import (
+    ContractImportView,
     ExpiringServiceList,
     PaymentDueServiceList,
     PingView,
     ReminderEmailLogListView,
     ReminderEmailTriggerView,
     ReminderListView,
+    ReminderReportHistoryView,
     ReminderReportView,
+    SearchView,
     ServiceContractViewSet,
     VendorViewSet,
 )
@@ -19,7 +23,9 @@ router.register(r"services", ServiceContractViewSet, basename="service")
 
 urlpatterns = [
     path("ping/", PingView.as_view(), name="ping"),
-    path("", include(router.urls)),
+    path("search/", SearchView.as_view(), name="search"),
+    # Registered before the router so ``services/<pk>/`` does not shadow them.
+    path("services/import/", ContractImportView.as_view(), name="services-import"),
     path("services/expiring-soon/", ExpiringServiceList.as_view(), name="services-expiring"),
     path("services/payment-due/", PaymentDueServiceList.as_view(), name="services-payment-due"),
     path("services/reminders/", ReminderListView.as_view(), name="services-reminders"),
@@ -28,6 +34,11 @@ urlpatterns = [
         ReminderReportView.as_view(),
         name="services-reminders-report",
     ),
+    path(
+        "services/reminders/report/history/",
+        ReminderReportHistoryView.as_view(),
+        name="services-reminders-report-history",
+    ),
     path(
         "services/reminders/send-emails/",
         ReminderEmailTriggerView.as_view(),
@@ -38,4 +49,22 @@ urlpatterns = [
         ReminderEmailLogListView.as_view(),
         name="services-reminders-email-logs",
     ),
+    path("async/ping/", async_views.ping, name="async-ping"),
+    path(
+        "async/services/expiring-soon/",
+        async_views.expiring_services,
+        name="async-services-expiring",
+    ),
+    path(
+        "async/services/payment-due/",
+        async_views.payment_due_services,
+        name="async-services-payment-due",
+    ),
+    path("async/services/reminders/", async_views.reminder_list, name="async-services-reminders"),
+    path(
+        "async/services/reminders/report/",
+        async_views.reminder_report,
+        name="async-services-reminders-report",
+    ),
+    path("", include(router.urls)),
 ]
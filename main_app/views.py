@@ -1,22 +1,66 @@
+import io
 from datetime import timedelta
 
+from django.db.models import Prefetch
 from django.utils import timezone
-from rest_framework import generics, status, viewsets
+from rest_framework import generics, serializers, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import EmailLog, ServiceContract, ServiceStatus, Vendor
+from .changes import ChangesFeedMixin
+from .coalescing import SingleFlight
+from .conditional import (
+    ConditionalGetMixin,
+    conditional_response,
+    latest_change,
+    queryset_version,
+    report_validators,
+)
+from .filters import ServiceContractFilterBackend, WindowParamsSerializer
+from .imports import FORMATS, ContractImporter, detect_format
+from .models import (
+    EmailLog,
+    ReminderSnapshot,
+    ServiceContract,
+    ServiceStatus,
+    Tombstone,
+    Vendor,
+)
 from .reminders import ReminderService
+from .routers import ReportingReadsMixin, pin_to_primary
+from .search import KIND_CODES, KIND_SERVICE, KIND_VENDOR, get_search_backend
 from .serializers import (
     EmailLogSerializer,
     ReminderSerializer,
     ReminderReportSerializer,
+    ReminderSnapshotSerializer,
+    SearchResultSerializer,
     ServiceContractSerializer,
     ServiceStatusUpdateSerializer,
     VendorSerializer,
 )
+from .throttling import ScopedThrottle
+from .windows import DayBucketIndex
+
+
+# Actions whose responses honour ``?fields=``/``?expand=`` and can use a trimmed queryset.
+SPARSE_FIELDSET_ACTIONS = {"list", "retrieve", "changes"}
+
+
+def _model_columns(model) -> set[str]:
+    return {field.name for field in model._meta.concrete_fields}
+
+
+def _active_services_prefetch() -> Prefetch:
+    return Prefetch(
+        "services",
+        queryset=ServiceContract.objects.filter(status=ServiceStatus.ACTIVE),
+        to_attr="active_service_list",
+    )
 
 
 class PingView(APIView):
@@ -26,14 +70,73 @@ class PingView(APIView):
         return Response({"message": "pong"})
 
 
-class VendorViewSet(viewsets.ModelViewSet):
-    queryset = Vendor.objects.prefetch_related("services").all()
+class VendorViewSet(ConditionalGetMixin, ChangesFeedMixin, viewsets.ModelViewSet):
+    queryset = Vendor.objects.prefetch_related(_active_services_prefetch()).all()
     serializer_class = VendorSerializer
+    change_resource = Tombstone.RESOURCE_VENDOR
+
+    def get_queryset(self):
+        if self.action not in SPARSE_FIELDSET_ACTIONS:
+            return super().get_queryset()
+        fields, _expanded = VendorSerializer.requested_fields(self.request)
+        columns = {"id", "updated_at"} | (fields & _model_columns(Vendor))
+        queryset = Vendor.objects.only(*columns)
+        if "active_services" in fields:
+            queryset = queryset.prefetch_related(_active_services_prefetch())
+        return queryset
+
+    def get_list_version_parts(self, queryset):
+        # Vendors embed their active services, so service edits change the payload.
+        return [queryset_version(queryset), queryset_version(ServiceContract.objects.all())]
+
+    def get_list_last_modified(self, queryset):
+        return [
+            *super().get_list_last_modified(queryset),
+            latest_change(ServiceContract, Tombstone.RESOURCE_SERVICE),
+        ]
+
+    def get_detail_version_parts(self, instance):
+        return [instance.updated_at, queryset_version(instance.services.all())]
 
 
-class ServiceContractViewSet(viewsets.ModelViewSet):
-    queryset = ServiceContract.objects.select_related("vendor").all()
+class ServiceContractViewSet(ConditionalGetMixin, ChangesFeedMixin, viewsets.ModelViewSet):
+    queryset = ServiceContract.objects.all()
     serializer_class = ServiceContractSerializer
+    change_resource = Tombstone.RESOURCE_SERVICE
+    filter_backends = [ServiceContractFilterBackend, SearchFilter, OrderingFilter]
+    # Prefix matches (``^``) use the case-insensitive indexes of migration 0015.
+    search_fields = ["^service_name", "^vendor_name"]
+    ordering_fields = [
+        "service_name",
+        "vendor_name",
+        "vendor__name",
+        "start_date",
+        "expiry_date",
+        "payment_due_date",
+        "amount",
+        "status",
+        "updated_at",
+    ]
+
+    def get_queryset(self):
+        if self.action not in SPARSE_FIELDSET_ACTIONS:
+            return super().get_queryset()
+        fields, expanded = ServiceContractSerializer.requested_fields(self.request)
+        columns = {"id", "updated_at"} | (fields & _model_columns(ServiceContract))
+        queryset = ServiceContract.objects.all()
+        if "vendor" in expanded:
+            return queryset.select_related("vendor").only(*columns)
+        return queryset.only(*columns)
+
+    def get_list_version_parts(self, queryset):
+        # ``?expand=vendor`` embeds vendor rows, whose other fields change independently.
+        return [queryset_version(queryset), queryset_version(Vendor.objects.all())]
+
+    def get_detail_version_parts(self, instance):
+        parts = [instance.updated_at]
+        if ServiceContract._meta.get_field("vendor").is_cached(instance):
+            parts.append(instance.vendor.updated_at)
+        return parts
 
     @action(detail=True, methods=["post"], url_path="update-status")
     def update_status(self, request, pk=None):
@@ -42,54 +145,210 @@ class ServiceContractViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         contract.status = serializer.validated_data["status"]
         contract.save(update_fields=["status", "updated_at"])
-        return Response(self.get_serializer(contract).data)
+        response = Response(self.get_serializer(contract).data)
+        pin_to_primary(response, request.user)
+        return response
+
+
+class ContractImportView(APIView):
+    """Upserts vendors and contracts from an uploaded CSV or NDJSON ``file``.
+
+    The upload is streamed through :class:`~main_app.imports.ContractImporter`;
+    invalid rows are reported per line while the remaining rows are imported.
+    """
+
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise serializers.ValidationError({"file": "This field is required."})
+        file_format = request.data.get("file_format") or detect_format(upload.name)
+        if file_format not in FORMATS:
+            raise serializers.ValidationError(
+                {"file_format": f"Expected one of: {', '.join(FORMATS)}."}
+            )
+        stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        try:
+            result = ContractImporter().import_file(stream, file_format)
+        except UnicodeDecodeError:
+            raise serializers.ValidationError({"file": "File must be UTF-8 encoded."})
+        finally:
+            stream.detach()
+        response = Response(result.as_dict(), status=status.HTTP_200_OK)
+        pin_to_primary(response, request.user)
+        return response
 
 
 class _BaseWindowServiceList(generics.ListAPIView):
+    """Contracts whose ``window_field`` falls within ``?days=`` (default 15) of today.
+
+    Ids come from the cached :class:`DayBucketIndex`; only the requested page is
+    loaded from the database and serialized.
+    """
+
     serializer_class = ServiceContractSerializer
+    window_field = ""
 
-    def _window_queryset(self, field_name: str):
-        today = timezone.now().date()
-        window_end = today + timedelta(days=15)
-        queryset = (
-            ServiceContract.objects.select_related("vendor")
-            .filter(status__in=[ServiceStatus.ACTIVE, ServiceStatus.PAYMENT_PENDING])
-            .filter(**{f"{field_name}__gte": today, f"{field_name}__lte": window_end})
-        )
-        return queryset
+    def list(self, request, *args, **kwargs):
+        params = WindowParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        today, days = timezone.localdate(), params.validated_data["days"]
+        index = DayBucketIndex(self.window_field)
+        ids = index.contract_ids(today, days)
+        page = self.paginate_queryset(ids)
+        page_ids = page if page is not None else ids
+        contracts = index.window(today, days).in_bulk(page_ids)
+        rows = [contracts[pk] for pk in page_ids if pk in contracts]
+        serializer = self.get_serializer(rows, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
 
 
 class ExpiringServiceList(_BaseWindowServiceList):
-    def get_queryset(self):
-        return self._window_queryset("expiry_date")
+    window_field = "expiry_date"
 
 
 class PaymentDueServiceList(_BaseWindowServiceList):
-    def get_queryset(self):
-        return self._window_queryset("payment_due_date")
+    window_field = "payment_due_date"
 
 
-class ReminderListView(APIView):
+class ReminderListView(ReportingReadsMixin, APIView):
+    throttle_classes = [ScopedThrottle]
+    throttle_scope = "reminders"
+
     def get(self, request):
-        payloads = ReminderService().build_reminder_payloads()
-        serializer = ReminderSerializer([payload.as_dict() for payload in payloads], many=True)
+        service = ReminderService()
+        etag, last_modified = report_validators(service.as_of, service.window_days)
+        return conditional_response(request, etag, last_modified, lambda: self._render(service))
+
+    def _render(self, service: ReminderService):
+        serializer = ReminderSerializer(service.iter_reminder_payloads(), many=True)
         return Response(serializer.data)
 
 
-class ReminderReportView(APIView):
+class ReminderReportView(ReportingReadsMixin, APIView):
+    throttle_classes = [ScopedThrottle]
+    throttle_scope = "reminders"
+    # Dashboards polling at the same moment share one report build per data version.
+    flight = SingleFlight()
+
     def get(self, request):
-        report = ReminderService().build_report()
-        serializer = ReminderReportSerializer(report)
-        return Response(serializer.data)
+        service = ReminderService()
+        etag, last_modified = report_validators(service.as_of, service.window_days)
+        return conditional_response(
+            request, etag, last_modified, lambda: self._render(service, etag)
+        )
+
+    def _render(self, service: ReminderService, etag: str):
+        data = self.flight.do(
+            (service.using, etag),
+            lambda: ReminderReportSerializer(service.build_report(lazy=True)).data,
+        )
+        return Response(data)
+
+
+class ReminderReportHistoryView(ReportingReadsMixin, generics.ListAPIView):
+    """Stored daily report totals for ``?from=``/``?to=`` (default: the last 30 days).
+
+    Rows are written by ``run_contract_reminders`` and ``backfill_reminder_reports``;
+    nothing is recomputed here.
+    """
+
+    serializer_class = ReminderSnapshotSerializer
+    pagination_class = None
+    default_days = 30
+    max_days = 731
+
+    def get_queryset(self):
+        params = self.request.query_params
+        end = self._date_param("to") or timezone.localdate()
+        start = self._date_param("from") or end - timedelta(days=self.default_days - 1)
+        if start > end:
+            raise serializers.ValidationError({"from": "Must not be after 'to'."})
+        if (end - start).days >= self.max_days:
+            raise serializers.ValidationError(
+                {"from": f"Ranges are limited to {self.max_days} days."}
+            )
+        window = serializers.IntegerField(min_value=0)
+        try:
+            window_days = window.run_validation(params.get("window", 15))
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({"window": exc.detail})
+        return ReminderSnapshot.objects.filter(
+            window_days=window_days, generated_on__gte=start, generated_on__lte=end
+        ).order_by("generated_on")
+
+    def _date_param(self, name: str):
+        value = self.request.query_params.get(name)
+        if value is None:
+            return None
+        try:
+            return serializers.DateField().run_validation(value)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({name: exc.detail})
 
 
 class ReminderEmailTriggerView(APIView):
+    throttle_classes = [ScopedThrottle]
+    throttle_scope = "send_emails"
+
     def post(self, request):
         payloads = ReminderService().send_notification_emails()
-        serializer = ReminderSerializer([payload.as_dict() for payload in payloads], many=True)
-        return Response({"sent": len(payloads), "reminders": serializer.data}, status=status.HTTP_200_OK)
+        serializer = ReminderSerializer(payloads, many=True)
+        response = Response({"sent": len(payloads), "reminders": serializer.data}, status=status.HTTP_200_OK)
+        pin_to_primary(response, request.user)
+        return response
 
 
-class ReminderEmailLogListView(generics.ListAPIView):
+class ReminderEmailLogListView(ReportingReadsMixin, generics.ListAPIView):
     serializer_class = EmailLogSerializer
-    queryset = EmailLog.objects.select_related("contract", "contract__vendor")
+    queryset = EmailLog.objects.select_related("contract")
+
+
+class SearchView(APIView):
+    """Ranked full-text search across vendors and service contracts."""
+
+    default_limit = 20
+    max_limit = 100
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise serializers.ValidationError({"q": "This query parameter is required."})
+        kinds = [kind for kind in request.query_params.getlist("type") if kind in KIND_CODES]
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            raise serializers.ValidationError({"limit": "Must be an integer."})
+        limit = max(1, min(limit, self.max_limit))
+
+        hits = get_search_backend().search(query, kinds=kinds or None, limit=limit)
+        vendors = Vendor.objects.in_bulk(
+            [hit.object_id for hit in hits if hit.kind == KIND_VENDOR]
+        )
+        services = ServiceContract.objects.in_bulk(
+            [hit.object_id for hit in hits if hit.kind == KIND_SERVICE]
+        )
+        results = []
+        for hit in hits:
+            if hit.kind == KIND_VENDOR and hit.object_id in vendors:
+                vendor = vendors[hit.object_id]
+                title, subtitle = vendor.name, vendor.email
+            elif hit.kind == KIND_SERVICE and hit.object_id in services:
+                contract = services[hit.object_id]
+                title, subtitle = contract.service_name, contract.vendor_name
+            else:
+                continue
+            results.append(
+                {
+                    "type": hit.kind,
+                    "id": hit.object_id,
+                    "title": title,
+                    "subtitle": subtitle,
+                    "rank": hit.rank,
+                }
+            )
+        serializer = SearchResultSerializer(results, many=True)
+        return Response({"query": query, "results": serializer.data})
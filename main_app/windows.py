@@ -0,0 +1,185 @@
+"""Per-day bucket index behind the expiring / payment-due window feeds."""
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import ServiceContract, ServiceStatus
+
+WINDOW_STATUSES = [ServiceStatus.ACTIVE, ServiceStatus.PAYMENT_PENDING]
+WINDOW_FIELDS = ("expiry_date", "payment_due_date")
+BUCKET_TIMEOUT = 60 * 60 * 24
+# Days per cache entry: a 366-day feed reads at most 24 blocks.
+BLOCK_DAYS = 16
+EPOCH_KEY = "window:epoch"
+
+
+def _token() -> str:
+    return uuid.uuid4().hex
+
+
+class DayBucketIndex:
+    """Caches contract ids by calendar day of ``field_name``, ``BLOCK_DAYS`` per entry.
+
+    A feed for ``[today, today + days]`` concatenates the blocks it spans, so the
+    7/15/30/90 day horizons share cached blocks and only blocks that are not
+    cached yet are read from the database, in one range query. Each block key
+    embeds a generation token that the contract signals replace when a row dated
+    in that block is saved or deleted; a reader that raced with the write stores
+    its rows under the old, unreachable token. Bulk writes that skip signals must
+    call :func:`invalidate_all`.
+
+    Tokens only reach other workers through a shared cache, so caching is off
+    unless ``WINDOW_BUCKET_INDEX`` is set (see ``main_app.checks``); the feeds
+    then run the indexed range query of :meth:`window` per request.
+    """
+
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+
+    @staticmethod
+    def _block(day: date) -> int:
+        ordinal = day.toordinal()
+        return ordinal - ordinal % BLOCK_DAYS
+
+    def _blocks(self, start: date, days: int) -> list[int]:
+        return list(
+            range(self._block(start), self._block(start + timedelta(days=days)) + 1, BLOCK_DAYS)
+        )
+
+    def _generation_key(self, block: int) -> str:
+        return f"window:{self.field_name}:generation:{block}"
+
+    def _generation_keys(self, blocks: list[int]) -> list[str]:
+        return [EPOCH_KEY, *(self._generation_key(block) for block in blocks)]
+
+    def _keys(self, blocks: list[int], tokens: dict) -> dict[int, str]:
+        epoch = tokens[EPOCH_KEY]
+        return {
+            block: f"window:{self.field_name}:{epoch}:{block}:"
+            f"{tokens[self._generation_key(block)]}"
+            for block in blocks
+        }
+
+    def _rows_by_block(self, rows: Iterable[tuple[date, int]], missing: list[int]) -> dict:
+        loaded: dict[int, list[tuple[int, int]]] = {block: [] for block in missing}
+        for day, contract_id in rows:
+            block = self._block(day)
+            if block in loaded:
+                loaded[block].append((day.toordinal(), contract_id))
+        return loaded
+
+    @staticmethod
+    def _concat(blocks, keys, cached, start: date, days: int) -> list[int]:
+        first, last = start.toordinal(), start.toordinal() + days
+        return [
+            contract_id
+            for block in blocks
+            for day, contract_id in cached[keys[block]]
+            if first <= day <= last
+        ]
+
+    def _tokens(self, blocks: list[int]) -> dict:
+        keys = self._generation_keys(blocks)
+        tokens = cache.get_many(keys)
+        missing = [key for key in keys if key not in tokens]
+        if missing:
+            for key in missing:
+                cache.add(key, _token(), None)
+            tokens.update(cache.get_many(missing))
+        return tokens
+
+    async def _atokens(self, blocks: list[int]) -> dict:
+        keys = self._generation_keys(blocks)
+        tokens = await cache.aget_many(keys)
+        missing = [key for key in keys if key not in tokens]
+        if missing:
+            for key in missing:
+                await cache.aadd(key, _token(), None)
+            tokens.update(await cache.aget_many(missing))
+        return tokens
+
+    def window(self, start: date, days: int):
+        """Window contracts dated ``start`` .. ``start + days``, read from the database.
+
+        Feeds load their page through it too, so ids from a stale block never
+        return a contract that has left the window.
+        """
+
+        end = start + timedelta(days=days)
+        return ServiceContract.objects.filter(
+            status__in=WINDOW_STATUSES,
+            **{f"{self.field_name}__gte": start, f"{self.field_name}__lte": end},
+        )
+
+    def contract_ids(self, start: date, days: int) -> list[int]:
+        """Ids of window contracts dated ``start`` .. ``start + days``, in date order."""
+
+        if not enabled():
+            rows = self.window(start, days).order_by(self.field_name, "id")
+            return list(rows.values_list("id", flat=True))
+        blocks = self._blocks(start, days)
+        keys = self._keys(blocks, self._tokens(blocks))
+        cached = cache.get_many(keys.values())
+        missing = [block for block in blocks if keys[block] not in cached]
+        if missing:
+            rows = self._bucket_rows(missing[0], missing[-1]).iterator()
+            loaded = {
+                keys[block]: ids for block, ids in self._rows_by_block(rows, missing).items()
+            }
+            cache.set_many(loaded, BUCKET_TIMEOUT)
+            cached.update(loaded)
+        return self._concat(blocks, keys, cached, start, days)
+
+    async def acontract_ids(self, start: date, days: int) -> list[int]:
+        """Async counterpart of :meth:`contract_ids` (async ORM and cache calls)."""
+
+        if not enabled():
+            rows = self.window(start, days).order_by(self.field_name, "id").values("id")
+            return [row["id"] async for row in rows.aiterator()]
+        blocks = self._blocks(start, days)
+        keys = self._keys(blocks, await self._atokens(blocks))
+        cached = await cache.aget_many(keys.values())
+        missing = [block for block in blocks if keys[block] not in cached]
+        if missing:
+            # values() rows: values_list() querysets cannot be consumed by aiterator().
+            rows = self._bucket_rows(missing[0], missing[-1]).values(self.field_name, "id")
+            fetched = [(row[self.field_name], row["id"]) async for row in rows.aiterator()]
+            loaded = {
+                keys[block]: ids
+                for block, ids in self._rows_by_block(fetched, missing).items()
+            }
+            await cache.aset_many(loaded, BUCKET_TIMEOUT)
+            cached.update(loaded)
+        return self._concat(blocks, keys, cached, start, days)
+
+    def invalidate(self, days: Iterable[date | None]) -> None:
+        """Start new generations for the blocks holding ``days``."""
+
+        blocks = {self._block(day) for day in days if day is not None}
+        if blocks:
+            cache.set_many({self._generation_key(block): _token() for block in blocks}, None)
+
+    def _bucket_rows(self, first_block: int, last_block: int):
+        days = last_block + BLOCK_DAYS - 1 - first_block
+        return (
+            self.window(date.fromordinal(first_block), days)
+            .order_by(self.field_name, "id")
+            .values_list(self.field_name, "id")
+        )
+
+
+def enabled() -> bool:
+    """Whether feeds read ids from cached blocks (``WINDOW_BUCKET_INDEX``)."""
+
+    return getattr(settings, "WINDOW_BUCKET_INDEX", False)
+
+
+def invalidate_all() -> None:
+    """Drop every cached block, e.g. after ``bulk_create`` or ``QuerySet.update()``."""
+
+    cache.set(EPOCH_KEY, _token(), None)
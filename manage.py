@@ -3,9 +3,21 @@
 import os
 import sys
 
+# Commands that only need the ORM and mail start with core_project.batch_settings.
+BATCH_COMMANDS = {
+    "backfill_reminder_reports",
+    "rebuild_search_index",
+    "retry_failed_reminders",
+    "run_contract_reminders",
+}
+
 
 def main() -> None:
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core_project.settings")
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    os.environ.setdefault(
+        "DJANGO_SETTINGS_MODULE",
+        "core_project.batch_settings" if command in BATCH_COMMANDS else "core_project.settings",
+    )
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc: